@@ -0,0 +1,72 @@
+from typing import Iterator, List, NamedTuple
+
+import numpy as np
+
+from spatial import SpatialHash
+
+
+# Everything one collision pass found, handed to the game in one batch
+class CollisionEvents(NamedTuple):
+    hits: np.ndarray  # rows of the predators touching the hunter
+    captures: List  # creatures caught this pass, already removed
+    points: int  # their combined value
+
+
+# Live creatures in an unordered list plus a grid for radius queries. Each
+# creature remembers its slot in the list, so removing one just moves the
+# last creature into that slot.
+class CreatureSet:
+    def __init__(self, cell_size: float):
+        self.items: List = []
+        self.grid = SpatialHash(cell_size)
+
+    def __len__(self):
+        return len(self.items)
+
+    def __iter__(self) -> Iterator:
+        return iter(self.items)
+
+    def add(self, creature):
+        creature.slot = len(self.items)
+        self.items.append(creature)
+        self.grid.insert(creature)
+
+    def remove(self, creature):
+        last = self.items.pop()
+        if last is not creature:
+            self.items[creature.slot] = last
+            last.slot = creature.slot
+        self.grid.remove(creature)
+
+    def clear(self):
+        self.items.clear()
+        self.grid.clear()
+
+    def query_radius(self, x: float, y: float, radius: float) -> Iterator:
+        return self.grid.query_radius(x, y, radius)
+
+
+# Broadphase for the hunter: only grid cells within its reach are searched,
+# so the cost depends on how crowded the hunter's surroundings are rather
+# than on the total number of predators and creatures.
+class CollisionSystem:
+    def __init__(self, predator_grid: SpatialHash, creatures: CreatureSet):
+        self.predator_grid = predator_grid
+        self.creatures = creatures
+
+    def check(self, hunter, store, current_time: float) -> CollisionEvents:
+        # Predators within touching distance; the exact test reuses the
+        # squared distances left by this tick's update
+        touch = store.radius + hunter.size
+        rows = np.array([predator.index for predator in
+                         self.predator_grid.query_cells(hunter.x, hunter.y, touch)], dtype=np.intp)
+        hits = rows[store.dist_sq[rows] < touch * touch]
+
+        # Visible creatures inside the hunter's detection radius are captured
+        captures = [creature for creature in
+                    self.creatures.query_radius(hunter.x, hunter.y, hunter.detection_radius)
+                    if creature.visible_at(current_time)]
+        for creature in captures:
+            self.creatures.remove(creature)
+
+        return CollisionEvents(hits, captures, sum(creature.type.points for creature in captures))
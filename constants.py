@@ -0,0 +1,8 @@
+SCREEN_WIDTH = 1024
+SCREEN_HEIGHT = 768
+FPS = 60  # render rate, and the default simulation tick rate
+MAX_FRAME_TIME = 250  # ms of real time a single rendered frame may simulate
+SCORE_INTERVAL = 100 * 1000 / FPS  # ms of game time between score awards
+
+SPAWN_THRESHOLD = 200
+MIN_SPACING = 100
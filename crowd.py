@@ -0,0 +1,91 @@
+from typing import Tuple
+
+import numpy as np
+
+# Cell offsets that visit every pair of neighbouring cells exactly once: the
+# cell itself plus the four "forward" neighbours of the 3x3 block
+HALF_NEIGHBOURHOOD = ((0, 0), (1, -1), (1, 0), (1, 1), (0, 1))
+
+
+# Every unordered pair (i, j) of points closer than radius, listed once, found
+# through a uniform grid with cell_size == radius. The grid is rebuilt every
+# call with one sort: points sorted by cell key form one contiguous run per
+# occupied cell, and neighbouring cells are matched with searchsorted over the
+# sorted cell keys. The cost grows with the number of points and close pairs
+# rather than n^2.
+def neighbour_pairs(x: np.ndarray, y: np.ndarray, radius: float) -> Tuple[np.ndarray, np.ndarray]:
+    n = len(x)
+    empty = np.empty(0, dtype=np.intp)
+    if n < 2:
+        return empty, empty
+
+    cell_x = np.floor(x / radius).astype(np.int64)
+    cell_y = np.floor(y / radius).astype(np.int64)
+    cell_x -= cell_x.min()
+    cell_y -= cell_y.min() - 1  # keep a free row below, so cy - 1 stays inside the key range
+    stride = int(cell_y.max()) + 2
+    keys = cell_x * stride + cell_y
+
+    order = np.argsort(keys)
+    sorted_keys = keys[order]
+    cell_start = np.flatnonzero(np.concatenate(([True], sorted_keys[1:] != sorted_keys[:-1])))
+    cell_count = np.diff(np.append(cell_start, n))
+    cell_keys = sorted_keys[cell_start]
+    # Cell of every point, in sorted order
+    point_cell = np.repeat(np.arange(len(cell_keys)), cell_count)
+
+    firsts, seconds = [], []
+    for offset_x, offset_y in HALF_NEIGHBOURHOOD:
+        # Shifting sorted keys keeps them sorted, which searchsorted is fast at
+        wanted = cell_keys + (offset_x * stride + offset_y)
+        found = np.minimum(np.searchsorted(cell_keys, wanted), len(cell_keys) - 1)
+        present = cell_keys[found] == wanted
+        counts = np.where(present, cell_count[found], 0)[point_cell]
+        total = int(counts.sum())
+        if not total:
+            continue
+
+        # Pair every point with each point of its neighbour cell's run
+        first = np.repeat(np.arange(n), counts)
+        run_offsets = np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts)
+        second = np.repeat(cell_start[found][point_cell], counts) + run_offsets
+        if offset_x == 0 and offset_y == 0:
+            keep = first < second
+            first = first[keep]
+            second = second[keep]
+
+        first = order[first]
+        second = order[second]
+        dx = x[first] - x[second]
+        dy = y[first] - y[second]
+        close = dx * dx + dy * dy < radius * radius
+        firsts.append(first[close])
+        seconds.append(second[close])
+
+    if not firsts:
+        return empty, empty
+    return np.concatenate(firsts), np.concatenate(seconds)
+
+
+# Separation steering: each point is pushed directly away from every
+# neighbour closer than radius, by (1 - distance / radius), so overlapping
+# neighbours push hardest. Returns the summed push per point.
+def separation(x: np.ndarray, y: np.ndarray, radius: float) -> Tuple[np.ndarray, np.ndarray]:
+    n = len(x)
+    first, second = neighbour_pairs(x, y, radius)
+    if not len(first):
+        return np.zeros(n), np.zeros(n)
+
+    dx = x[first] - x[second]
+    dy = y[first] - y[second]
+    dist = np.sqrt(dx * dx + dy * dy)
+    # Points on top of each other have no direction between them; split them along x
+    stacked = dist == 0
+    dx[stacked] = 1.0
+    dist[stacked] = 1.0
+
+    weight = (1 - dist / radius) / dist
+    push_x = dx * weight
+    push_y = dy * weight
+    return (np.bincount(first, push_x, n) - np.bincount(second, push_x, n),
+            np.bincount(first, push_y, n) - np.bincount(second, push_y, n))
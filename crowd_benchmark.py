@@ -0,0 +1,89 @@
+import argparse
+import math
+import time
+from typing import Dict
+
+import numpy as np
+
+from constants import FPS
+from crowd import neighbour_pairs, separation
+from main import Hunter
+from predators import PredatorStore
+
+
+# O(n^2) separation over every pair at once, for comparison with the grid
+def naive_separation(x: np.ndarray, y: np.ndarray, radius: float):
+    dx = x[:, None] - x[None, :]
+    dy = y[:, None] - y[None, :]
+    dist = np.sqrt(dx * dx + dy * dy)
+    np.fill_diagonal(dist, np.inf)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        weight = np.where(dist < radius, (1 - dist / radius) / dist, 0)
+    return (weight * dx).sum(axis=1), (weight * dy).sum(axis=1)
+
+
+def median_gap(store: PredatorStore, cap: float = 50) -> float:
+    # Median distance to the nearest other predator, counted as cap when none is closer
+    x, y = store.x[:store.count], store.y[:store.count]
+    first, second = neighbour_pairs(x, y, cap)
+    nearest = np.full(store.count, float(cap))
+    dist = np.hypot(x[first] - x[second], y[first] - y[second])
+    np.minimum.at(nearest, first, dist)
+    np.minimum.at(nearest, second, dist)
+    return float(np.median(nearest))
+
+
+# n predators start spread over a disc around a standing hunter, all chasing,
+# and close in for `frames` ticks. Returns the per-tick time and final spacing.
+def run_crowd(n: int, frames: int, separation_radius: float, seed: int) -> Dict[str, float]:
+    rng = np.random.default_rng(seed)
+    hunter = Hunter(0, 0, math.inf, math.inf)
+    store = PredatorStore(capacity=n, detection_radius=math.inf, separation_radius=separation_radius)
+
+    # About one predator per 50x50 px; 10k of them reach the hunter in ~1100 ticks
+    disc = math.sqrt(n * 50 * 50 / math.pi)
+    angle = rng.uniform(0, 2 * math.pi, n)
+    dist = disc * np.sqrt(rng.uniform(0, 1, n))
+    for x, y in zip((dist * np.cos(angle)).tolist(), (dist * np.sin(angle)).tolist()):
+        store.add(x, y, 150)
+
+    dt = 1 / FPS
+    start = time.perf_counter()
+    for _ in range(frames):
+        store.update(hunter, dt)
+    elapsed = time.perf_counter() - start
+    return {"update": elapsed / frames, "gap": median_gap(store), "store": store}
+
+
+def time_call(function, *args, repeat: int = 5) -> float:
+    best = math.inf
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Per-tick cost of predator crowd separation")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000], help="numbers of chasing predators")
+    parser.add_argument("--frames", type=int, default=1200, help="ticks each crowd closes in for")
+    parser.add_argument("--naive-max", type=int, default=4000, help="largest n to time the O(n^2) version at")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    print(f"{'n':>7} {'update_ms':>10} {'+separate_ms':>13} {'grid_ms':>9} {'naive_ms':>9} "
+          f"{'gap_off_px':>11} {'gap_on_px':>10}")
+    for n in args.sizes:
+        plain = run_crowd(n, args.frames, 0, args.seed)
+        steered = run_crowd(n, args.frames, 50, args.seed)
+
+        # Both separation versions timed on the same settled crowd
+        store = steered["store"]
+        x, y = store.x[:store.count], store.y[:store.count]
+        grid = time_call(separation, x, y, store.separation_radius)
+        naive = time_call(naive_separation, x, y, store.separation_radius) if n <= args.naive_max else math.nan
+
+        print(f"{n:>7} {plain['update'] * 1000:>10.3f} {steered['update'] * 1000:>13.3f} "
+              f"{grid * 1000:>9.3f} {naive * 1000:>9.3f} "
+              f"{plain['gap']:>11.1f} {steered['gap']:>10.1f}", flush=True)
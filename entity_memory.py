@@ -0,0 +1,188 @@
+import argparse
+import math
+import random
+import sys
+import time
+import tracemalloc
+from typing import Dict, Optional, Tuple
+
+import headless  # noqa: F401  (selects the dummy SDL drivers before pygame starts)
+import pygame
+
+from refactored import BLUE, GREEN, PURPLE, SCREEN_WIDTH, SCREEN_HEIGHT, Creature, CreatureType, Hunter, Predator
+
+CREATURE_TYPES = [
+    CreatureType(BLUE, 10, 15, False, 0, 5),
+    CreatureType(GREEN, 20, 20, False, 0, 3),
+    CreatureType(PURPLE, 50, 25, True, 2000, 1),
+]
+
+
+# Dict-backed entities as they were before __slots__, kept here only so the
+# benchmark can compare against them.
+class LegacyHunter:
+    def __init__(self, x: int, y: int):
+        self.x = x
+        self.y = y
+        self.speed = 5
+        self.base_detection_radius = 200
+        self.detection_radius = self.base_detection_radius
+        self.stealth_mode = False
+        self.stealth_cooldown = 0
+        self.stealth_duration = 3000
+        self.stealth_recovery = 5000
+        self.score = 0
+        self.size = 20
+        self.initial_x = x
+        self.initial_y = y
+        self.distance_traveled = 0
+
+
+class LegacyCreature:
+    def __init__(self, x: int, y: int, creature_type: CreatureType):
+        self.x = x
+        self.y = y
+        self.type = creature_type
+        self.spawn_time = pygame.time.get_ticks()
+        self.visible = not creature_type.nocturnal
+        self.last_visibility_toggle = self.spawn_time
+
+    def update(self, current_time: int):
+        if self.type.nocturnal:
+            if current_time - self.last_visibility_toggle >= self.type.visibility_duration:
+                self.visible = not self.visible
+                self.last_visibility_toggle = current_time
+
+
+class LegacyPredator:
+    def __init__(self, x: int, y: int):
+        self.x = x
+        self.y = y
+        self.speed = 2.5
+        self.radius = 25
+        self.detection_radius = 250
+        self.chasing = False
+        self.target: Optional[Tuple[float, float]] = None
+        self.visible = False
+
+    def update(self, hunter):
+        dx = hunter.x - self.x
+        dy = hunter.y - self.y
+        dist = math.sqrt(dx * dx + dy * dy)
+
+        if dist < self.detection_radius and not hunter.stealth_mode:
+            self.chasing = True
+            self.target = (hunter.x, hunter.y)
+        elif self.chasing and hunter.stealth_mode:
+            self.chasing = False
+            self.target = None
+
+        if self.chasing and self.target:
+            dx = self.target[0] - self.x
+            dy = self.target[1] - self.y
+            dist = math.sqrt(dx * dx + dy * dy)
+            if dist > 0:
+                self.x += (dx / dist) * self.speed
+                self.y += (dy / dist) * self.speed
+
+        self.visible = dist <= hunter.detection_radius
+
+
+VARIANTS = {
+    "legacy": (LegacyHunter, LegacyPredator, LegacyCreature),
+    "slotted": (Hunter, Predator, Creature),
+}
+
+
+def make(kind: str, cls, rng: random.Random):
+    x = rng.uniform(0, SCREEN_WIDTH)
+    y = rng.uniform(0, SCREEN_HEIGHT)
+    if kind == "creature":
+        return cls(x, y, rng.choice(CREATURE_TYPES))
+    return cls(x, y)
+
+
+# Traced bytes per instance, including its __dict__ when it has one. The
+# list holding the instances is subtracted.
+def bytes_per_entity(kind: str, cls, count: int, seed: int) -> float:
+    rng = random.Random(seed)
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    entities = [make(kind, cls, rng) for _ in range(count)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return (after - before - sys.getsizeof(entities)) / count
+
+
+# Steps a crowd of predators and creatures around a hunter that circles the
+# screen centre. Predators start inside the detection radius, so they all
+# chase and write a new target every frame.
+def frame_costs(variant: str, count: int, frames: int, seed: int) -> Dict[str, float]:
+    hunter_cls, predator_cls, creature_cls = VARIANTS[variant]
+    rng = random.Random(seed)
+    cx, cy = SCREEN_WIDTH / 2, SCREEN_HEIGHT / 2
+    hunter = hunter_cls(cx, cy)
+    predators = []
+    for _ in range(count):
+        angle = rng.uniform(0, 2 * math.pi)
+        dist = rng.uniform(60, predator_cls(0, 0).detection_radius * 0.9)
+        predators.append(predator_cls(cx + dist * math.cos(angle), cy + dist * math.sin(angle)))
+    creatures = [make("creature", creature_cls, rng) for _ in range(count)]
+    # Slotted creatures work out visibility when asked and have no per-frame update
+    blinking = creatures if hasattr(creature_cls, "update") else []
+
+    def step(frame: int):
+        hunter.x = cx + 40 * math.cos(frame / 20)
+        hunter.y = cy + 40 * math.sin(frame / 20)
+        for predator in predators:
+            predator.update(hunter)
+        for creature in blinking:
+            creature.update(frame * 1000 // 60)
+
+    step(0)  # first frame allocates the targets and warms the float free list
+    tracemalloc.start()
+    retained = transient = blocks = 0
+    for frame in range(1, frames + 1):
+        tracemalloc.reset_peak()
+        size_before, _ = tracemalloc.get_traced_memory()
+        blocks_before = sys.getallocatedblocks()
+        step(frame)
+        size_after, peak = tracemalloc.get_traced_memory()
+        blocks += sys.getallocatedblocks() - blocks_before
+        retained += size_after - size_before
+        transient += peak - size_before
+    tracemalloc.stop()
+
+    start = time.perf_counter()
+    for frame in range(frames + 1, 2 * frames + 1):
+        step(frame)
+    elapsed = time.perf_counter() - start
+
+    return {
+        "blocks": blocks / frames,
+        "retained": retained / frames,
+        "transient": transient / frames,
+        "us": elapsed / frames * 1e6,
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Per-entity memory and per-frame allocations, dict-backed vs slotted")
+    parser.add_argument("--count", type=int, default=10_000, help="instances per entity type")
+    parser.add_argument("--frames", type=int, default=100)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    print("bytes per entity")
+    print(f"  {'entity':<10} {'legacy':>10} {'slotted':>10}")
+    for position, kind in enumerate(("hunter", "predator", "creature")):
+        legacy = bytes_per_entity(kind, VARIANTS["legacy"][position], args.count, args.seed)
+        slotted = bytes_per_entity(kind, VARIANTS["slotted"][position], args.count, args.seed)
+        print(f"  {kind:<10} {legacy:>10.1f} {slotted:>10.1f}")
+
+    print(f"per frame, {args.count} chasing predators + {args.count} creatures")
+    print(f"  {'variant':<10} {'net_blocks':>10} {'retained_B':>11} {'transient_B':>12} {'frame_us':>10}")
+    for variant in VARIANTS:
+        costs = frame_costs(variant, args.count, args.frames, args.seed)
+        print(f"  {variant:<10} {costs['blocks']:>10.1f} {costs['retained']:>11.1f} "
+              f"{costs['transient']:>12.1f} {costs['us']:>10.1f}")
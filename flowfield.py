@@ -0,0 +1,136 @@
+import math
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+
+Rect = Tuple[int, int, int, int]  # x, y, width, height
+
+# Obstacle layouts as fractions of the world size, so they scale with it.
+# All of them leave the hunter's start position in the middle clear.
+OBSTACLE_LAYOUTS: Dict[str, List[Tuple[float, float, float, float]]] = {
+    "none": [],
+    "pillars": [
+        (0.20, 0.20, 0.08, 0.12), (0.72, 0.20, 0.08, 0.12),
+        (0.20, 0.68, 0.08, 0.12), (0.72, 0.68, 0.08, 0.12),
+    ],
+    "walls": [
+        (0.30, 0.00, 0.03, 0.40), (0.30, 0.60, 0.03, 0.40),
+        (0.67, 0.25, 0.03, 0.50),
+        (0.40, 0.15, 0.20, 0.03), (0.40, 0.82, 0.20, 0.03),
+    ],
+}
+
+PURSUIT_MODES = ("direct", "flow")
+
+UNREACHED = np.iinfo(np.int32).max
+
+# Neighbour offsets as (dx, dy); each FlowField turns them into flat-index steps
+ORTHOGONAL = ((1, 0), (-1, 0), (0, 1), (0, -1))
+DIAGONAL = ((1, 1), (1, -1), (-1, 1), (-1, -1))
+
+
+def obstacle_rects(layout: str, width: int, height: int) -> List[Rect]:
+    return [(int(fx * width), int(fy * height), int(fw * width), int(fh * height))
+            for fx, fy, fw, fh in OBSTACLE_LAYOUTS[layout]]
+
+
+# Grid over the world holding, for every cell, the BFS step count to the goal
+# cell and the direction of the neighbouring cell that is one or two steps
+# closer. It is recomputed only when the goal moves to another cell, and any
+# number of agents read it with one array lookup each, instead of each one
+# searching for a path. The grid has a one-cell blocked border, so neighbour
+# lookups never need bounds checks.
+class FlowField:
+    def __init__(self, width: float, height: float, cell_size: float = 32, obstacles: Sequence[Rect] = ()):
+        self.cell_size = cell_size
+        self.cols = math.ceil(width / cell_size)
+        self.rows = math.ceil(height / cell_size)
+        self.obstacles = list(obstacles)
+
+        blocked = np.ones((self.rows + 2, self.cols + 2), dtype=bool)
+        blocked[1:-1, 1:-1] = False
+        for x, y, w, h in self.obstacles:
+            # Every cell the rectangle overlaps
+            left = max(int(x // cell_size), 0)
+            top = max(int(y // cell_size), 0)
+            right = min(math.ceil((x + w) / cell_size), self.cols)
+            bottom = min(math.ceil((y + h) / cell_size), self.rows)
+            blocked[1 + top:1 + bottom, 1 + left:1 + right] = True
+        self.blocked = blocked.ravel()
+
+        stride = self.cols + 2
+        self.steps = np.array([dx + dy * stride for dx, dy in ORTHOGONAL])
+        self.goal = -1
+        self.distance = np.full(self.blocked.size, UNREACHED, dtype=np.int32)
+        self.dir_x = np.zeros(self.blocked.size)
+        self.dir_y = np.zeros(self.blocked.size)
+        self.recomputes = 0
+
+    def cell_index(self, x, y):
+        # Flat index into the bordered grid; positions outside the world clamp to the edge cells
+        col = np.clip(np.floor_divide(x, self.cell_size).astype(np.intp), 0, self.cols - 1)
+        row = np.clip(np.floor_divide(y, self.cell_size).astype(np.intp), 0, self.rows - 1)
+        return (row + 1) * (self.cols + 2) + col + 1
+
+    def is_blocked(self, x: float, y: float) -> bool:
+        return bool(self.blocked[self.cell_index(x, y)])
+
+    def blocked_at(self, x: np.ndarray, y: np.ndarray) -> np.ndarray:
+        return self.blocked[self.cell_index(x, y)]
+
+    def retarget(self, x: float, y: float) -> bool:
+        goal = int(self.cell_index(x, y))
+        if goal == self.goal:
+            return False
+        self.goal = goal
+        self.compute()
+        return True
+
+    def compute(self):
+        self.recomputes += 1
+        distance = self.distance
+        distance.fill(UNREACHED)
+        free = ~self.blocked
+
+        # Breadth-first search, one whole wavefront per NumPy step
+        if free[self.goal]:
+            distance[self.goal] = 0
+            frontier = np.array([self.goal])
+            step = 0
+            while frontier.size:
+                step += 1
+                neighbours = (frontier[:, None] + self.steps).ravel()
+                neighbours = np.unique(neighbours[free[neighbours] & (distance[neighbours] == UNREACHED)])
+                distance[neighbours] = step
+                frontier = neighbours
+
+        # Point every cell at its closest neighbour. Diagonals only count when
+        # both cells beside them are open, so paths never cut a wall's corner.
+        grid = distance.reshape(self.rows + 2, self.cols + 2)
+        open_grid = free.reshape(self.rows + 2, self.cols + 2)
+        inner = (slice(1, -1), slice(1, -1))
+
+        def shifted(array, dx, dy):
+            return array[1 + dy:self.rows + 1 + dy, 1 + dx:self.cols + 1 + dx]
+
+        offsets = ORTHOGONAL + DIAGONAL
+        candidates = []
+        for dx, dy in offsets:
+            neighbour = shifted(grid, dx, dy)
+            if dx and dy:
+                corners_open = shifted(open_grid, dx, 0) & shifted(open_grid, 0, dy)
+                neighbour = np.where(corners_open, neighbour, UNREACHED)
+            candidates.append(neighbour)
+        candidates = np.stack(candidates)
+        best = candidates.argmin(axis=0)
+        improves = candidates.min(axis=0) < grid[inner]
+
+        unit = np.array([(dx, dy) for dx, dy in offsets], dtype=float)
+        unit /= np.hypot(unit[:, 0], unit[:, 1])[:, None]
+        self.dir_x.reshape(grid.shape)[inner] = np.where(improves, unit[best, 0], 0)
+        self.dir_y.reshape(grid.shape)[inner] = np.where(improves, unit[best, 1], 0)
+
+    def sample(self, x: np.ndarray, y: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        # Direction toward the goal and BFS steps left for each position
+        cells = self.cell_index(x, y)
+        return self.dir_x[cells], self.dir_y[cells], self.distance[cells]
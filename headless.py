@@ -0,0 +1,122 @@
+import os
+
+# Must be set before pygame opens a window
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import argparse
+import random
+import time
+from typing import FrozenSet, Iterable, Iterator, List, Optional, Tuple
+
+import pygame
+
+from constants import FPS
+from flowfield import OBSTACLE_LAYOUTS, PURSUIT_MODES
+from main import Game
+from memprofile import add_memprofile_arguments, profiler_from_args
+from spawners import SPAWNERS, default_spawner_name
+
+MOVE_KEYS = (pygame.K_w, pygame.K_a, pygame.K_s, pygame.K_d)
+
+# One frame of scripted input: the events to deliver and the keys held down
+Frame = Tuple[List[pygame.event.Event], FrozenSet[int]]
+
+
+# Advances by exactly one frame per tick instead of sleeping, so a 60 second
+# session takes as long as the simulation itself and never drifts.
+class VirtualClock:
+    def __init__(self, start: int = 0):
+        self.ticks = float(start)
+
+    def tick(self, framerate: int):
+        step = 1000 / framerate
+        self.ticks += step
+        return step
+
+    def get_ticks(self) -> int:
+        return int(self.ticks)
+
+
+class HeldKeys:
+    def __init__(self, keys: FrozenSet[int]):
+        self.keys = keys
+
+    def __getitem__(self, key: int) -> bool:
+        return key in self.keys
+
+
+# Replays a per-frame script in place of the keyboard. Once the script runs
+# out it sends QUIT, which ends Game.run().
+class ScriptedInput:
+    def __init__(self, script: Iterable[Frame]):
+        self.script: Iterator[Frame] = iter(script)
+        self.held: FrozenSet[int] = frozenset()
+
+    def get_events(self):
+        try:
+            events, self.held = next(self.script)
+        except StopIteration:
+            self.held = frozenset()
+            return [pygame.event.Event(pygame.QUIT)]
+        return events
+
+    def get_pressed(self):
+        return HeldKeys(self.held)
+
+
+def key_event(key: int) -> pygame.event.Event:
+    return pygame.event.Event(pygame.KEYDOWN, key=key)
+
+
+# Presses SPACE, then wanders with WASD, changing direction every hold_frames
+# frames and sometimes using stealth. Same seed, same keystrokes.
+def random_walk(seed: int, frames: int, hold_frames: int = 30, stealth_chance: float = 0.002) -> Iterator[Frame]:
+    rng = random.Random(seed)
+    held: FrozenSet[int] = frozenset()
+
+    yield [key_event(pygame.K_SPACE)], held
+    for frame in range(1, frames):
+        if frame % hold_frames == 0:
+            held = frozenset(rng.sample(MOVE_KEYS, rng.randint(0, 2)))
+        events = [key_event(pygame.K_LSHIFT)] if rng.random() < stealth_chance else []
+        yield events, held
+
+
+def run_headless(spawner: Optional[str] = None, seed: int = 0, level_time: Optional[int] = None,
+                 render: bool = False, report: bool = True, **game_options) -> Game:
+    game = Game(spawner, clock=VirtualClock(), seed=seed, render=render, **game_options)
+    if level_time is not None:
+        game.level_time = level_time
+
+    # One frame to start, one session, then a couple of frames on the game over screen
+    frames = game.level_time * FPS + 3
+    game.input = ScriptedInput(random_walk(seed, frames))
+    game.run(report)
+    return game
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run one scripted session without a window")
+    parser.add_argument("--spawner", default=default_spawner_name(), choices=sorted(SPAWNERS))
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--level-time", type=int, default=None, help="session length in seconds")
+    parser.add_argument("--render", action="store_true", help="also draw every frame to the dummy display")
+    parser.add_argument("--tick-rate", type=int, default=FPS, help="simulation steps per second")
+    parser.add_argument("--obstacles", default="none", choices=sorted(OBSTACLE_LAYOUTS))
+    parser.add_argument("--pursuit", default="direct", choices=PURSUIT_MODES)
+    parser.add_argument("--creatures", type=int, default=20, help="creatures kept on the field")
+    parser.add_argument("--creature-spacing", type=float, default=30)
+    add_memprofile_arguments(parser)
+    args = parser.parse_args()
+
+    wall_start = time.perf_counter()
+    game = run_headless(args.spawner, args.seed, args.level_time, args.render,
+                        memory_profiler=profiler_from_args(args), tick_rate=args.tick_rate,
+                        obstacles=args.obstacles, pursuit=args.pursuit,
+                        max_creatures=args.creatures, creature_spacing=args.creature_spacing)
+    wall_time = time.perf_counter() - wall_start
+
+    print(f"spawner={game.spawner.name} seed={args.seed} score={game.hunter.score} "
+          f"predators={len(game.predators)} creatures={len(game.creatures)} ticks={game.tick_count} "
+          f"wall={wall_time:.3f}s")
@@ -1,17 +1,26 @@
 import pygame
-import random
-import math
+import argparse
+from contextlib import contextmanager
 from enum import Enum
-from typing import List, Tuple, Optional
+from dataclasses import dataclass
+from typing import Dict, Iterator, List, Tuple, Optional
 import time
-import tracemalloc
+import numpy as np
+from constants import SCREEN_WIDTH, SCREEN_HEIGHT, FPS, MAX_FRAME_TIME, SCORE_INTERVAL, SPAWN_THRESHOLD, MIN_SPACING
+from spatial import SpatialHash
+from predators import PredatorStore
+from stats import StreamingStats
+from memprofile import PHASES, PhaseMemoryProfiler, add_memprofile_arguments, profiler_from_args
+from sampling import POISSON_DENSITY, SpawnStream, tiled_poisson_disk_samples
+from spawners import SPAWNERS, CreatureSpawner, create_spawner, default_spawner_name
+from flowfield import OBSTACLE_LAYOUTS, PURSUIT_MODES, FlowField, obstacle_rects
+from collisions import CollisionEvents, CollisionSystem, CreatureSet
+from scheduler import Scheduler
+from rendering import SpriteCache, TextCache
+from visibility import blink_visible
 
 pygame.init()
 
-SCREEN_WIDTH = 1024
-SCREEN_HEIGHT = 768
-FPS = 60
-
 WHITE = (255, 255, 255)
 BLACK = (0, 0, 0)
 RED = (255, 0, 0)
@@ -21,27 +30,49 @@ YELLOW = (255, 255, 0)
 PURPLE = (147, 0, 211)
 DARK_OVERLAY = (0, 0, 0, 128)  
 
+# Frozen so a type can key its sprite
+@dataclass(frozen=True)
+class CreatureType:
+    color: Tuple[int, int, int]
+    points: int
+    radius: int
+    nocturnal: bool
+    visibility_duration: int  # in milliseconds
+    spawn_weight: int
+
 class GameState(Enum):
     MENU = "menu"
     PLAYING = "playing"
     PAUSED = "paused"
     GAME_OVER = "game_over"
 
+# Tuning constants are class attributes; only per-hunter state is slotted
 class Hunter:
-    def __init__(self, x: int, y: int):
+    __slots__ = ("x", "y", "prev_x", "prev_y", "world_width", "world_height", "detection_radius",
+                 "stealth_mode", "stealth_cooldown", "score")
+
+    speed = 300  # pixels per second
+    base_detection_radius = 200  # Increased from 150
+    stealth_duration = 3000  # 3 seconds
+    stealth_recovery = 5000  # 5 seconds
+    size = 20  # Player size
+
+    def __init__(self, x: int, y: int, world_width: int = SCREEN_WIDTH, world_height: int = SCREEN_HEIGHT):
         self.x = x
         self.y = y
-        self.speed = 5
-        self.base_detection_radius = 200  # Increased from 150
+        # Position before the latest tick, for interpolated drawing
+        self.prev_x = x
+        self.prev_y = y
+        self.world_width = world_width
+        self.world_height = world_height
         self.detection_radius = self.base_detection_radius
         self.stealth_mode = False
         self.stealth_cooldown = 0
-        self.stealth_duration = 3000  # 3 seconds
-        self.stealth_recovery = 5000  # 5 seconds
         self.score = 0
-        self.size = 20  # Player size
 
-    def move(self, keys):
+    def move(self, keys, dt: float):
+        self.prev_x = self.x
+        self.prev_y = self.y
         dx = 0
         dy = 0
         if keys[pygame.K_w]: dy -= 1
@@ -54,243 +85,365 @@ class Hunter:
             dx *= 0.707
             dy *= 0.707
             
-        speed = self.speed * (0.5 if self.stealth_mode else 1)
-        self.x = max(self.size, min(SCREEN_WIDTH - self.size, self.x + dx * speed))
-        self.y = max(self.size, min(SCREEN_HEIGHT - self.size, self.y + dy * speed))
+        speed = self.speed * dt * (0.5 if self.stealth_mode else 1)
+        self.x = max(self.size, min(self.world_width - self.size, self.x + dx * speed))
+        self.y = max(self.size, min(self.world_height - self.size, self.y + dy * speed))
 
-    def toggle_stealth(self, current_time):
+    def toggle_stealth(self, current_time) -> bool:
+        # True when stealth starts; the caller schedules end_stealth for when it runs out
         if not self.stealth_mode and current_time > self.stealth_cooldown:
             self.stealth_mode = True
             self.detection_radius = self.base_detection_radius * 0.4
             self.stealth_cooldown = current_time + self.stealth_duration + self.stealth_recovery
+            return True
         elif self.stealth_mode and current_time > self.stealth_cooldown - self.stealth_recovery:
-            self.stealth_mode = False
-            self.detection_radius = self.base_detection_radius
+            self.end_stealth(current_time)
+        return False
 
-    def update(self, current_time):
-        if self.stealth_mode and current_time > self.stealth_cooldown - self.stealth_recovery:
-            self.stealth_mode = False
-            self.detection_radius = self.base_detection_radius
+    def end_stealth(self, current_time):
+        self.stealth_mode = False
+        self.detection_radius = self.base_detection_radius
 
-class Predator:
-    def __init__(self, x: int, y: int):
+# slot is the creature's position in the game's CreatureSet, for O(1) removal.
+# Visibility is worked out when asked, so creatures need no per-tick update.
+class Creature:
+    __slots__ = ("x", "y", "type", "spawn_time", "slot")
+
+    def __init__(self, x: float, y: float, creature_type: CreatureType, spawn_time: float):
         self.x = x
         self.y = y
-        self.speed = 2.5
-        self.radius = 25 
-        self.detection_radius = 250
-        self.chasing = False
-        self.target: Optional[Tuple[float, float]] = None
-        self.visible = False
-
-    def update(self, hunter: Hunter):
-        dx = hunter.x - self.x
-        dy = hunter.y - self.y
-        dist = math.sqrt(dx * dx + dy * dy)
-
-        if dist < self.detection_radius and not hunter.stealth_mode:
-            self.chasing = True
-            self.target = (hunter.x, hunter.y)
-        elif self.chasing and hunter.stealth_mode:
-            self.chasing = False
-            self.target = None
-
-        if self.chasing and self.target:
-            dx = self.target[0] - self.x
-            dy = self.target[1] - self.y
-            dist = math.sqrt(dx * dx + dy * dy)
-            if dist > 0:
-                self.x += (dx / dist) * self.speed
-                self.y += (dy / dist) * self.speed
-
-        self.visible = dist <= hunter.detection_radius or self.chasing
+        self.type = creature_type
+        self.spawn_time = spawn_time
+        self.slot = -1
+
+    def visible_at(self, current_time: float) -> bool:
+        return blink_visible(self.type, current_time - self.spawn_time)
+
+# Lightweight view of one row of a PredatorStore, for code that works with
+# individual predators. Game.update_entities updates the whole store at once.
+class Predator:
+    __slots__ = ("store", "index")
+
+    def __init__(self, store: PredatorStore, index: int):
+        self.store = store
+        self.index = index
+
+    @property
+    def x(self) -> float:
+        return float(self.store.x[self.index])
+
+    @x.setter
+    def x(self, value: float):
+        self.store.x[self.index] = value
+
+    @property
+    def y(self) -> float:
+        return float(self.store.y[self.index])
+
+    @y.setter
+    def y(self, value: float):
+        self.store.y[self.index] = value
+
+    @property
+    def speed(self) -> float:
+        return float(self.store.speed[self.index])
+
+    @property
+    def radius(self) -> int:
+        return self.store.radius
+
+    @property
+    def detection_radius(self) -> float:
+        return self.store.detection_radius
+
+    @property
+    def chasing(self) -> bool:
+        return bool(self.store.chasing[self.index])
+
+    @property
+    def target(self) -> Optional[Tuple[float, float]]:
+        if not self.chasing:
+            return None
+        return (float(self.store.target_x[self.index]), float(self.store.target_y[self.index]))
+
+    @property
+    def visible(self) -> bool:
+        return bool(self.store.visible[self.index])
+
+    def update(self, hunter: Hunter, dt: float):
+        self.store.update(hunter, dt, np.array([self.index]))
 
     def is_visible(self) -> bool:
         return self.visible
 
-class Game:
+# Wall-clock time source. Headless runs swap in headless.VirtualClock.
+class RealClock:
     def __init__(self):
+        self.clock = pygame.time.Clock()
+
+    def tick(self, framerate: int):
+        return self.clock.tick(framerate)
+
+    def get_ticks(self) -> int:
+        return pygame.time.get_ticks()
+
+# Live keyboard and window events. Headless runs swap in headless.ScriptedInput.
+class KeyboardInput:
+    def get_events(self):
+        return pygame.event.get()
+
+    def get_pressed(self):
+        return pygame.key.get_pressed()
+
+class Game:
+    def __init__(self, spawner: Optional[str] = None, clock=None, input_source=None,
+                 seed: Optional[int] = None, render: bool = True,
+                 memory_profiler: Optional[PhaseMemoryProfiler] = None,
+                 max_predators: int = 50, num_spawn_locations: int = 50,
+                 world_width: int = SCREEN_WIDTH, world_height: int = SCREEN_HEIGHT,
+                 tick_rate: int = FPS, obstacles: str = "none", pursuit: str = "direct",
+                 max_creatures: int = 20, creature_spacing: float = 30):
+        # A previous Game.run() may have shut pygame down
+        if not pygame.get_init():
+            pygame.init()
         self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
         pygame.display.set_caption("Hunter's Halo")
-        self.clock = pygame.time.Clock()
+        self.clock = clock or RealClock()
+        self.input = input_source or KeyboardInput()
+        self.render = render
         self.font = pygame.font.Font(None, 36)
+        # Menu, game over and stealth strings are rendered once here; HUD
+        # values are rendered again only when the text they show changes
+        self.text = TextCache(self.font)
+        for text in ("Hunter's Halo", "Press SPACE to start", "WASD to move",
+                     "Press SPACE to restart", "STEALTH ACTIVE", ""):
+            self.text.pin(text, WHITE)
         
         self.state = GameState.MENU
         self.level_time = 60  # seconds
-        self.time_remaining = self.level_time
         self.start_time = 0
+        # Level end, score awards, stealth expiry and spawn cooldowns wait here
+        # until they are due, instead of being checked every tick
+        self.scheduler = Scheduler()
+
+        # The simulation advances in fixed steps of 1 / tick_rate seconds, however
+        # fast frames are drawn; current_time is game time in ms, counted in ticks
+        self.tick_rate = tick_rate
+        self.dt = 1 / tick_rate
+        self.tick_ms = 1000 / tick_rate
+        self.tick_count = 0
+
+        # The playing field; larger than the screen only in scaling benchmarks
+        self.world_width = world_width
+        self.world_height = world_height
         
-        self.hunter = Hunter(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2)
+        self.hunter = self.new_hunter()
+        # Predator state lives in contiguous arrays; self.predators holds views in row order
+        self.predator_store = PredatorStore()
         self.predators: List[Predator] = []
-
-        self.time_data = []
-        self.last_spawn_time = 0
-        self.score_delay = 0
-
-        self.num_spawn_locations = 50
-        self.potential_predator_spawns = []
-        spawn_radius = 500
-        for _ in range(self.num_spawn_locations):
-            angle = random.uniform(0, 2 * math.pi)
-            distance = random.uniform(200, spawn_radius)
-            x = self.hunter.x + math.cos(angle) * distance
-            y = self.hunter.y + math.sin(angle) * distance
-            self.potential_predator_spawns.append((x, y))
-
-
-    """---------------------------------------------------------------------------------------------------------------------------------
-       -----------  PRECOMPUTED SPAWN -------------------------------------------------------------------------------------------------
-       ---------------------------------------------------------------------------------------------------------------------------------"""
-    def precomputed_spawning_original(self):
-        spawn_threshold = 200  
-        min_spacing = 100   
-
-        for spawn_location in self.potential_predator_spawns:
-
-            dist_to_hunter = math.sqrt((spawn_location[0] - self.hunter.x) ** 2 + (spawn_location[1] - self.hunter.y) ** 2)
-
-            if dist_to_hunter < spawn_threshold:
-                too_close = False
-                for predator in self.predators:
-                    dist_to_predator = math.sqrt((spawn_location[0] - predator.x) ** 2 + (spawn_location[1] - predator.y) ** 2)
-                    if dist_to_predator < min_spacing:
-                        too_close = True
-                        break
-                
-                if not too_close:
-                    self.potential_predator_spawns.remove(spawn_location)
-                    self.predators.append(Predator(spawn_location[0], spawn_location[1]))
-                    break 
-
-    def precomputed_spawning_refactored(self):
-        spawn_threshold = 200  
-        min_spacing = 100   
-
-        current_time = pygame.time.get_ticks()
-        if len(self.predators) >= self.num_spawn_locations or current_time - self.last_spawn_time < 2000 or (self.hunter.x == 512 and self.hunter.y == 384):
-            return
-
-        for spawn_location in self.potential_predator_spawns:
-
-            dist_to_hunter = math.sqrt((spawn_location[0] - self.hunter.x) ** 2 + (spawn_location[1] - self.hunter.y) ** 2)
-
-            if dist_to_hunter < spawn_threshold:
-                too_close = False
-                for predator in self.predators:
-                    dist_to_predator = math.sqrt((spawn_location[0] - predator.x) ** 2 + (spawn_location[1] - predator.y) ** 2)
-                    if dist_to_predator < min_spacing:
-                        too_close = True
-                        break
-                
-                if not too_close:
-
-                    self.last_spawn_time = current_time
-                    
-                    self.potential_predator_spawns.remove(spawn_location)
-                    self.predators.append(Predator(spawn_location[0], spawn_location[1]))
-                    break 
-
-
-    """---------------------------------------------------------------------------------------------------------------------------------
-       -----------  RADIAL SPAWN  ------------------------------------------------------------------------------------------------------
-       ---------------------------------------------------------------------------------------------------------------------------------"""
-
-    # insert new spawning algo here
-
-    def radial_spawn(self):
-        if len(self.predators) >= 50:
-            return
-
-        spawn_threshold = 200
-        min_spacing = 100
-        num_points = 360
-
-        for angle in range(num_points):
-            rad = math.radians(angle)
-            x = self.hunter.x + spawn_threshold * math.cos(rad)
-            y = self.hunter.y + spawn_threshold * math.sin(rad)
-
-            if not (0 <= x <= SCREEN_WIDTH and 0 <= y <= SCREEN_HEIGHT):
-                continue
-
-            dist_to_hunter = math.hypot(x - self.hunter.x, y - self.hunter.y)
-            
-            if spawn_threshold / 2 < dist_to_hunter < spawn_threshold:
-                too_close = False
-                for predator in self.predators:
-                    if math.hypot(x - predator.x, y - predator.y) < min_spacing:
-                        too_close = True
-                        break
-
-                if not too_close:
-                    self.predators.append(Predator(x, y))
-                    return
+        self.predator_grid = SpatialHash(MIN_SPACING)
+        # Rows updated last frame; everything else is asleep until the hunter comes near
+        self.awake = np.empty(0, dtype=np.intp)
+
+        self.creature_types = [
+            CreatureType(BLUE, 10, 15, False, 0, 5),    # Common
+            CreatureType(GREEN, 20, 20, False, 0, 3),   # Uncommon
+            CreatureType(PURPLE, 50, 25, True, 2000, 1) # Rare nocturnal
+        ]
+        self.creatures = CreatureSet(MIN_SPACING)
+
+        # Every entity appearance is rasterized once here and blitted from then on
+        self.sprites = SpriteCache()
+        radius = self.predator_store.radius
+        self.predator_sprite = self.sprites.circle(RED, radius, (255, 100, 100), radius + 8)
+        self.creature_sprites = {creature_type: self.sprites.circle(creature_type.color, creature_type.radius,
+                                                                    creature_type.color, creature_type.radius + 5)
+                                 for creature_type in self.creature_types}
+        self.hunter_sprites = {stealth: self.sprites.circle(color, Hunter.size, color, Hunter.size + 5)
+                               for stealth, color in ((False, WHITE), (True, (100, 100, 100)))}
+        # Hunter-centred broadphase over both grids; the last tick's results stay here
+        self.collisions = CollisionSystem(self.predator_grid, self.creatures)
+        self.collision_events = CollisionEvents(np.empty(0, dtype=np.intp), [], 0)
+
+        # Obstacles block the hunter and predators; with "flow" pursuit chasers
+        # share one flow field toward the hunter to find their way around them
+        self.flow_field = FlowField(self.world_width, self.world_height,
+                                    obstacles=obstacle_rects(obstacles, self.world_width, self.world_height))
+        self.predator_store.flow_field = self.flow_field
+        self.predator_store.follow_field = pursuit == "flow"
+
+        # Per-frame spawn latency, kept as running statistics rather than a list
+        self.spawn_stats = StreamingStats()
+        # Traces allocations in selected phases only; does nothing by default
+        self.profiler = memory_profiler or PhaseMemoryProfiler()
+        # Wall time of each phase the last time it ran, in seconds
+        self.phase_times: Dict[str, float] = dict.fromkeys(PHASES, 0.0)
+        self.current_time = 0
+
+        # Every random draw goes through this generator, so a seed makes runs repeatable
+        self.np_rng = np.random.default_rng(seed)
+
+        self.num_spawn_locations = num_spawn_locations
+        self.max_predators = max_predators
+        self.potential_predator_spawns = self.build_spawn_pool()
+        # Refills itself around the hunter, so restarts and long sessions never run dry
+        self.spawn_stream = SpawnStream(2 * self.num_spawn_locations, SPAWN_THRESHOLD / 2, SPAWN_THRESHOLD,
+                                        self.world_width, self.world_height, self.np_rng)
+        self.spawn_stream.reset(self.potential_predator_spawns)
+
+        self.spawner = create_spawner(spawner or default_spawner_name(), self)
+        self.max_creatures = max_creatures
+        self.creature_spawner = CreatureSpawner(self, creature_spacing)
+
+    def new_hunter(self) -> Hunter:
+        return Hunter(self.world_width // 2, self.world_height // 2, self.world_width, self.world_height)
+
+    def build_spawn_pool(self) -> List[Tuple[float, float]]:
+        # Blue-noise pool over the screen-sized area around the start position:
+        # every candidate is in the world and min_spacing from the others. The
+        # points are packed tighter than plain Bridson so the default 50 fit, with
+        # a few tries; only a pool that still comes up short is packed closer.
+        start_x = self.world_width // 2
+        start_y = self.world_height // 2
+        count = self.num_spawn_locations
+
+        def sample(spacing: float) -> np.ndarray:
+            pool = tiled_poisson_disk_samples(SCREEN_WIDTH, SCREEN_HEIGHT, spacing, self.np_rng, spread=1.25)
+            pool += (start_x - SCREEN_WIDTH // 2, start_y - SCREEN_HEIGHT // 2)
+            # Keep the start position clear, like the old 200-500px polar pool
+            offset = pool - (start_x, start_y)
+            return pool[(offset ** 2).sum(axis=1) >= SPAWN_THRESHOLD ** 2]
+
+        spacing = MIN_SPACING
+        for _ in range(3):
+            pool = sample(spacing)
+            if len(pool) >= count:
+                break
+        else:
+            area = SCREEN_WIDTH * SCREEN_HEIGHT - np.pi * SPAWN_THRESHOLD ** 2
+            spacing = min(MIN_SPACING, (area * POISSON_DENSITY / count) ** 0.5)
+            pool = sample(spacing)
+        if len(pool) < count:
+            raise ValueError(f"Spawn pool holds {len(pool)} candidates at {spacing:.1f}px spacing, {count} requested")
+        pool = pool[self.np_rng.permutation(len(pool))]
+        return list(map(tuple, pool[:count].tolist()))
+
+    def add_predator(self, x: float, y: float):
+        # Spawners only pick points outside obstacles
+        predator = Predator(self.predator_store, self.predator_store.add(x, y, 150))  # 150 px/s
+        self.predators.append(predator)
+        self.predator_grid.insert(predator)
+
+    def add_creature(self, x: float, y: float, creature_type: CreatureType):
+        self.creatures.add(Creature(x, y, creature_type, self.current_time))
+
+    def clear_predators(self):
+        self.predator_store.clear()
+        self.predators.clear()
+        self.predator_grid.clear()
+        self.awake = np.empty(0, dtype=np.intp)
+
+    def update_entities(self, current_time: float, keys):
+        self.hunter.move(keys, self.dt)
+        if self.flow_field.obstacles and self.flow_field.is_blocked(self.hunter.x, self.hunter.y):
+            self.slide_hunter()
+
+        # An idle predator only needs updating once the hunter is within its
+        # detection radius, so wake the grid cells around the hunter plus
+        # everyone still chasing. Stealth drops the chasers, and they fall
+        # asleep on the next frame.
+        store = self.predator_store
+        near = [predator.index for predator in
+                self.predator_grid.query_cells(self.hunter.x, self.hunter.y, store.detection_radius)]
+        chasing = self.awake[store.chasing[self.awake]]
+        active = np.union1d(chasing, np.array(near, dtype=np.intp))
+        store.sleep(np.setdiff1d(self.awake, active, assume_unique=True))
+        self.awake = active
+
+        # Only chasing predators move, so only they can change grid cells
+        for index in store.update(self.hunter, self.dt, active).tolist():
+            self.predator_grid.move(self.predators[index])
+
+
+    def slide_hunter(self):
+        # The move ended inside an obstacle: keep whichever axis of it is free
+        hunter = self.hunter
+        if not self.flow_field.is_blocked(hunter.x, hunter.prev_y):
+            hunter.y = hunter.prev_y
+        elif not self.flow_field.is_blocked(hunter.prev_x, hunter.y):
+            hunter.x = hunter.prev_x
+        else:
+            hunter.x = hunter.prev_x
+            hunter.y = hunter.prev_y
 
     def check_collisions(self):
-        for predator in self.predators:
-            dx = self.hunter.x - predator.x
-            dy = self.hunter.y - predator.y
-            dist = math.sqrt(dx * dx + dy * dy)
+        events = self.collisions.check(self.hunter, self.predator_store, self.current_time)
+        self.hunter.score += events.points
+        self.collision_events = events
 
 
-            # DISABLE THIS WHEN TESTING SPAWNING PERFORMANCE
-            """ if dist < predator.radius + self.hunter.size:
-                self.state = GameState.GAME_OVER """
+        # DISABLE THIS WHEN TESTING SPAWNING PERFORMANCE
+        """ if len(events.hits):
+            self.state = GameState.GAME_OVER """
 
-    def draw(self):
-        
+    def draw(self, alpha: float = 1.0):
+        # alpha is how far the current frame lies between the last two ticks
         self.screen.fill((20, 20, 30))  
 
         if self.state == GameState.MENU:
-            title_text = self.font.render("Hunter's Halo", True, WHITE)
-            menu_text = self.font.render("Press SPACE to start", True, WHITE)
-            controls_text = self.font.render("WASD to move", True, WHITE)
+            title_text = self.text.render("Hunter's Halo", WHITE)
+            menu_text = self.text.render("Press SPACE to start", WHITE)
+            controls_text = self.text.render("WASD to move", WHITE)
             
             self.screen.blit(title_text, (SCREEN_WIDTH // 2 - 100, SCREEN_HEIGHT // 2 - 50))
             self.screen.blit(menu_text, (SCREEN_WIDTH // 2 - 100, SCREEN_HEIGHT // 2))
             self.screen.blit(controls_text, (SCREEN_WIDTH // 2 - 100, SCREEN_HEIGHT // 2 + 50))
 
         elif self.state == GameState.GAME_OVER:
-            over_text = self.font.render(f"Game Over! Final Score: {self.hunter.score}", True, WHITE)
-            restart_text = self.font.render("Press SPACE to restart", True, WHITE)
+            over_text = self.text.render(f"Game Over! Final Score: {self.hunter.score}", WHITE)
+            restart_text = self.text.render("Press SPACE to restart", WHITE)
             self.screen.blit(over_text, (SCREEN_WIDTH // 2 - 150, SCREEN_HEIGHT // 2))
             self.screen.blit(restart_text, (SCREEN_WIDTH // 2 - 100, SCREEN_HEIGHT // 2 + 50))
 
         else:
         
+            for rect in self.flow_field.obstacles:
+                pygame.draw.rect(self.screen, (60, 60, 80), rect)
+
             # Draw detection radius
+            hunter = self.hunter
+            hunter_pos = (int(hunter.prev_x + (hunter.x - hunter.prev_x) * alpha),
+                          int(hunter.prev_y + (hunter.y - hunter.prev_y) * alpha))
             pygame.draw.circle(self.screen, (40, 40, 60), 
-                            (int(self.hunter.x), int(self.hunter.y)),
-                            int(self.hunter.detection_radius),
+                            hunter_pos,
+                            int(hunter.detection_radius),
                             2)  # Just the outline
 
-            # Draw visible predators
-            for predator in self.predators:
-                if predator.is_visible():
-                    # Draw predator body
-                    pygame.draw.circle(self.screen, RED,
-                                    (int(predator.x), int(predator.y)),
-                                    predator.radius)
-                    # Add threatening glow effect
-                    pygame.draw.circle(self.screen, (255, 100, 100),
-                                    (int(predator.x), int(predator.y)),
-                                    predator.radius + 8, 2)
-
-            # Draw player
-            player_color = (100, 100, 100) if self.hunter.stealth_mode else WHITE
-            pygame.draw.circle(self.screen, player_color,
-                            (int(self.hunter.x), int(self.hunter.y)), 
-                            self.hunter.size)
-            # Add player glow effect
-            glow_radius = self.hunter.size + 5
-            pygame.draw.circle(self.screen, player_color,
-                            (int(self.hunter.x), int(self.hunter.y)),
-                            glow_radius, 2)
+            # Visible creatures, then visible predators, then the player, all
+            # blitted from their sprites in one batch
+            blits = []
+            for creature in self.creatures.query_radius(hunter.x, hunter.y, hunter.detection_radius):
+                if creature.visible_at(self.current_time):
+                    surface, offset = self.creature_sprites[creature.type]
+                    blits.append((surface, (int(creature.x) - offset, int(creature.y) - offset)))
+
+            store = self.predator_store
+            visible = np.flatnonzero(store.visible[:store.count])
+            surface, offset = self.predator_sprite
+            prev_x = store.prev_x[visible]
+            prev_y = store.prev_y[visible]
+            xs = ((prev_x + (store.x[visible] - prev_x) * alpha).astype(int) - offset).tolist()
+            ys = ((prev_y + (store.y[visible] - prev_y) * alpha).astype(int) - offset).tolist()
+            blits.extend(zip([surface] * len(xs), zip(xs, ys)))
+
+            surface, offset = self.hunter_sprites[hunter.stealth_mode]
+            blits.append((surface, (hunter_pos[0] - offset, hunter_pos[1] - offset)))
+            self.screen.blits(blits, False)
 
             # Draw HUD
-            score_text = self.font.render(f"Score: {self.hunter.score}", True, WHITE)
-            time_text = self.font.render(f"Time: {int(self.time_remaining)}s", True, WHITE)
-            stealth_text = self.font.render("STEALTH ACTIVE" if self.hunter.stealth_mode else "", True, WHITE)
+            score_text = self.text.render(f"Score: {self.hunter.score}", WHITE)
+            time_text = self.text.render(f"Time: {int(self.time_remaining)}s", WHITE)
+            stealth_text = self.text.render("STEALTH ACTIVE" if self.hunter.stealth_mode else "", WHITE)
             
             self.screen.blit(score_text, (10, 10))
             self.screen.blit(time_text, (10, 50))
@@ -298,91 +451,126 @@ class Game:
 
         pygame.display.flip()
 
-    def run(self):
+    @property
+    def time_remaining(self) -> float:
+        return self.level_time - (self.current_time - self.start_time) / 1000
+
+    def start_level(self):
+        self.scheduler.clear()
+        self.start_time = self.current_time
+        self.scheduler.schedule(self.start_time + self.level_time * 1000, self.end_level)
+        self.scheduler.schedule(self.start_time + SCORE_INTERVAL, self.award_score)
+
+    def end_level(self, current_time: float):
+        self.state = GameState.GAME_OVER
+
+    def award_score(self, current_time: float):
+        self.hunter.score += 5 * len(self.predators)
+        self.scheduler.schedule(current_time + SCORE_INTERVAL, self.award_score)
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[bool]:
+        # Times the phase and hands it to the memory profiler; yields whether it is traced
+        start = time.perf_counter()
+        with self.profiler.phase(name) as traced:
+            yield traced
+        self.phase_times[name] = time.perf_counter() - start
+
+    def tick(self, keys):
+        # One fixed simulation step
+        self.tick_count += 1
+        current_time = self.current_time = self.tick_count * self.tick_ms
+
+        # Fire the timed events that have come due
+        self.scheduler.run_due(current_time)
+        
+        # Update game objects
+        with self.phase("update"):
+            self.update_entities(current_time, keys)
+
+        # Spawn new entities with the strategy picked by --spawner / HUNTER_SPAWNER
+        with self.phase("spawn") as traced:
+            start_time = time.perf_counter()
+
+            self.spawner.spawn()
+
+            end_time = time.perf_counter()
+        # Frames where tracemalloc slowed the spawner down would skew the timings
+        if not traced:
+            self.spawn_stats.record(end_time - start_time)
+
+        # Creatures top themselves up in one batch, timed and traced on their own
+        with self.phase("creatures"):
+            self.creature_spawner.spawn()
+        
+        with self.phase("collisions"):
+            self.check_collisions()
+
+    def run(self, report: bool = True):
         running = True
+        # Real time not yet simulated, in ms
+        accumulator = 0.0
+        last_frame = self.clock.get_ticks()
         while running:
-            current_time = pygame.time.get_ticks()
+            now = self.clock.get_ticks()
+            # Capped, so one long stall cannot snowball into ever more catch-up ticks
+            accumulator += min(now - last_frame, MAX_FRAME_TIME)
+            last_frame = now
             
-            for event in pygame.event.get():
+            for event in self.input.get_events():
                 if event.type == pygame.QUIT:
                     running = False
                 elif event.type == pygame.KEYDOWN:
                     if event.key == pygame.K_SPACE:
                         if self.state in (GameState.MENU, GameState.GAME_OVER):
                             self.state = GameState.PLAYING
-                            self.hunter = Hunter(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2)
-                            self.predators.clear()
-                            self.time_remaining = self.level_time
-                            self.start_time = time.time()
+                            self.start_level()
+                            self.hunter = self.new_hunter()
+                            self.clear_predators()
+                            self.creatures.clear()
+                            self.potential_predator_spawns = self.build_spawn_pool()
+                            self.spawn_stream.reset(self.potential_predator_spawns)
+                            self.spawner.reset()
                     elif event.key == pygame.K_LSHIFT and self.state == GameState.PLAYING:
-                        self.hunter.toggle_stealth(current_time)
-
-            if self.state == GameState.PLAYING:
-                # Update time
-                self.time_remaining = self.level_time - (time.time() - self.start_time)
-                if self.time_remaining <= 0:
-                    self.state = GameState.GAME_OVER
-                
-                # Update game objects
-                keys = pygame.key.get_pressed()
-                self.hunter.move(keys)
-                self.hunter.update(current_time)
-                
-                for predator in self.predators:
-                    predator.update(self.hunter)
-                
-
-
-                """---------------------------------------------------------------------------
-                ---------  CHANGE SPAWNING MECHANISM HERE  -----------------------------------
-                ------------------------------------------------------------------------------"""
-                # Spawn new entities 
-
-                start_time = time.perf_counter()
-                #tracemalloc.start()
-
-
-                # SPAWNING ALGOS
-                #self.precomputed_spawning_original()
-                self.precomputed_spawning_refactored()
-                #self.radial_spawning()
-
-                #current, peak = tracemalloc.get_traced_memory()
-
-                #tracemalloc.stop()
-                #self.time_data.append(peak / 1024)
-                #self.time_data = sorted(self.time_data, reverse=True)[:5]
-
-                end_time = time.perf_counter()
-                self.time_data.append(end_time - start_time)
-                #print(f"Time: {end_time - start_time:.6f} seconds")
-                
-                self.check_collisions()
-
-                self.score_delay += 1
-
-                if self.score_delay >= 100:
-                    self.hunter.score += 5 * len(self.predators)
-                    self.score_delay = 0
-                    
-                
-
-            self.draw()
+                        hunter = self.hunter
+                        if hunter.toggle_stealth(self.current_time):
+                            self.scheduler.schedule(self.current_time + hunter.stealth_duration, hunter.end_stealth)
+
+            # Run as many whole ticks as the elapsed time covers, then draw
+            # partway between the last two
+            keys = self.input.get_pressed()
+            while accumulator >= self.tick_ms:
+                accumulator -= self.tick_ms
+                if self.state == GameState.PLAYING:
+                    self.tick(keys)
+
+            if self.render:
+                with self.phase("draw"):
+                    self.draw(accumulator / self.tick_ms)
+            self.profiler.next_frame()
             self.clock.tick(FPS)
 
-        if self.time_data:
-            x = 0
-            for i in self.time_data:
-                x += i
-
-            y = x / len(self.time_data)
-
-            #avg_peak = sum(self.time_data) / len(self.time_data)
-            #print(f"Average of top 3 peak memory usages: {avg_peak:.6f} KB")
-
-            print(f"{y:.6f}") 
+        if report:
+            if self.spawn_stats.count:
+                print(f"spawn[{self.spawner.name}] {self.spawn_stats.report()}")
+            for line in self.profiler.report():
+                print(line)
         pygame.quit()
 
 if __name__ == "__main__":
-    game = Game()
+    parser = argparse.ArgumentParser(description="Hunter's Halo spawning benchmark")
+    parser.add_argument("--spawner", default=default_spawner_name(), choices=sorted(SPAWNERS),
+                        help="spawning strategy (default: $HUNTER_SPAWNER or precomputed_refactored)")
+    parser.add_argument("--tick-rate", type=int, default=FPS, help="simulation steps per second (default: %(default)s)")
+    parser.add_argument("--obstacles", default="none", choices=sorted(OBSTACLE_LAYOUTS))
+    parser.add_argument("--pursuit", default="direct", choices=PURSUIT_MODES,
+                        help="how chasers reach the hunter: straight at it, or along a shared flow field")
+    parser.add_argument("--creatures", type=int, default=20, help="creatures kept on the field (default: %(default)s)")
+    parser.add_argument("--creature-spacing", type=float, default=30, help="minimum distance between creatures")
+    add_memprofile_arguments(parser)
+    args = parser.parse_args()
+
+    game = Game(args.spawner, memory_profiler=profiler_from_args(args), tick_rate=args.tick_rate,
+                obstacles=args.obstacles, pursuit=args.pursuit,
+                max_creatures=args.creatures, creature_spacing=args.creature_spacing)
     game.run()
\ No newline at end of file
@@ -0,0 +1,87 @@
+import tracemalloc
+from contextlib import contextmanager
+from typing import Dict, Iterable, List
+
+PHASES = ("spawn", "creatures", "update", "collisions", "draw")
+
+
+class PhaseTotals:
+    def __init__(self):
+        self.frames = 0
+        self.bytes = 0
+        self.blocks = 0
+        self.peak = 0
+
+
+# Traces allocations only inside the chosen frame phases. tracemalloc is
+# started on entry to a phase and stopped on exit, so the other phases (and
+# their timings) run at full speed, and with every > 1 only every Nth frame
+# is traced at all. Each traced phase contributes the net bytes and blocks it
+# left allocated (snapshot diff) and its peak traced memory.
+class PhaseMemoryProfiler:
+    def __init__(self, phases: Iterable[str] = (), every: int = 1):
+        self.phases = set(phases)
+        unknown = self.phases - set(PHASES)
+        if unknown:
+            raise ValueError(f"Unknown phase(s) {', '.join(sorted(unknown))}, expected: {', '.join(PHASES)}")
+
+        self.every = max(1, every)
+        self.frame = 0
+        self.totals: Dict[str, PhaseTotals] = {phase: PhaseTotals() for phase in self.phases}
+        # Leave out allocations made by tracemalloc and this module themselves
+        self.filters = [
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, __file__),
+        ]
+
+    def __bool__(self):
+        return bool(self.phases)
+
+    def next_frame(self):
+        self.frame += 1
+
+    @contextmanager
+    def phase(self, name: str):
+        if name not in self.phases or self.frame % self.every or tracemalloc.is_tracing():
+            yield False
+            return
+
+        tracemalloc.start()
+        before = tracemalloc.take_snapshot().filter_traces(self.filters)
+        try:
+            yield True
+        finally:
+            after = tracemalloc.take_snapshot().filter_traces(self.filters)
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+
+            totals = self.totals[name]
+            totals.frames += 1
+            for stat in after.compare_to(before, "filename"):
+                totals.bytes += stat.size_diff
+                totals.blocks += stat.count_diff
+            totals.peak = max(totals.peak, peak)
+
+    def report(self) -> List[str]:
+        lines = []
+        for name in PHASES:
+            totals = self.totals.get(name)
+            if totals is None or not totals.frames:
+                continue
+            lines.append(f"memory[{name}] frames={totals.frames} "
+                         f"alloc={totals.bytes / totals.frames:.1f}B/frame "
+                         f"blocks={totals.blocks / totals.frames:.2f}/frame "
+                         f"peak={totals.peak / 1024:.2f}KB")
+        return lines
+
+
+def add_memprofile_arguments(parser):
+    parser.add_argument("--memprofile", default="", metavar="PHASES",
+                        help=f"comma separated phases to trace allocations in ({', '.join(PHASES)})")
+    parser.add_argument("--memprofile-every", type=int, default=1, metavar="N",
+                        help="only trace every Nth frame")
+
+
+def profiler_from_args(args) -> PhaseMemoryProfiler:
+    phases = [phase.strip() for phase in args.memprofile.split(",") if phase.strip()]
+    return PhaseMemoryProfiler(phases, args.memprofile_every)
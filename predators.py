@@ -0,0 +1,167 @@
+import math
+from typing import Optional
+
+import numpy as np
+
+from crowd import separation
+from flowfield import UNREACHED
+
+
+# Struct-of-arrays predator population. Row i of every array belongs to
+# predator i; only the first `count` rows are live. One update() call runs
+# chase detection, the stealth drop-off, movement toward the target and the
+# visibility flag for the whole population with a handful of NumPy ops.
+# The same pass leaves each predator's squared distance to the hunter in
+# dist_sq, so collisions and drawing never measure it again. Chasers also
+# steer away from predators within separation_radius (0 turns that off), so
+# a crowd spreads out around the hunter instead of piling onto one point.
+# separation_weight sets how hard that push is against the pull of the target.
+# With a flow_field set, predators cannot enter its blocked cells, and when
+# follow_field is on chasers take the field's way around obstacles.
+class PredatorStore:
+    def __init__(self, capacity: int = 64, radius: int = 25, detection_radius: float = 250,
+                 separation_radius: float = 50, separation_weight: float = 6):
+        self.radius = radius
+        self.detection_radius = detection_radius
+        self.separation_radius = separation_radius
+        self.separation_weight = separation_weight
+        self.flow_field = None
+        self.follow_field = False
+        self.count = 0
+        # Hunter position of the last distance pass; nan until the first update
+        self.hunter_x = math.nan
+        self.hunter_y = math.nan
+        self.allocate(capacity)
+
+    def allocate(self, capacity: int):
+        old = self.count
+        arrays = {}
+        for name, dtype in (("x", float), ("y", float), ("speed", float),
+                            ("prev_x", float), ("prev_y", float),
+                            ("target_x", float), ("target_y", float), ("dist_sq", float),
+                            ("chasing", bool), ("visible", bool)):
+            array = np.zeros(capacity, dtype=dtype)
+            if old:
+                array[:old] = getattr(self, name)[:old]
+            arrays[name] = array
+        self.__dict__.update(arrays)
+
+    def __len__(self):
+        return self.count
+
+    def add(self, x: float, y: float, speed: float) -> int:
+        if self.count == len(self.x):
+            self.allocate(2 * len(self.x))
+
+        index = self.count
+        self.x[index] = x
+        self.y[index] = y
+        self.prev_x[index] = x
+        self.prev_y[index] = y
+        self.speed[index] = speed
+        self.chasing[index] = False
+        self.visible[index] = False
+        dx = self.hunter_x - x
+        dy = self.hunter_y - y
+        self.dist_sq[index] = dx * dx + dy * dy
+        self.count += 1
+        return index
+
+    def clear(self):
+        self.count = 0
+        self.hunter_x = math.nan
+        self.hunter_y = math.nan
+
+    def sleep(self, indices: np.ndarray):
+        # Rows that dropped out of the hunter's neighbourhood: nothing to draw,
+        # their distance is no longer tracked, and they stay where they are
+        self.visible[indices] = False
+        self.dist_sq[indices] = np.inf
+        self.prev_x[indices] = self.x[indices]
+        self.prev_y[indices] = self.y[indices]
+
+    def update(self, hunter, dt: float, indices: Optional[np.ndarray] = None) -> np.ndarray:
+        # Advances every live predator, or just `indices`, by dt seconds (speed is
+        # in pixels per second) and returns the rows that moved
+        rows = slice(0, self.count) if indices is None else indices
+        x = self.x[rows]
+        y = self.y[rows]
+        self.prev_x[rows] = x
+        self.prev_y[rows] = y
+        chasing = self.chasing[rows]
+        target_x = self.target_x[rows]
+        target_y = self.target_y[rows]
+
+        self.hunter_x = hunter.x
+        self.hunter_y = hunter.y
+        dx = hunter.x - x
+        dy = hunter.y - y
+        dist_sq = dx * dx + dy * dy
+
+        # Spotting the hunter (re)targets its current position; stealth drops every chase
+        if hunter.stealth_mode:
+            chasing[:] = False
+        else:
+            spotted = dist_sq < self.detection_radius * self.detection_radius
+            chasing |= spotted
+            target_x[spotted] = hunter.x
+            target_y[spotted] = hunter.y
+
+        dx = target_x - x
+        dy = target_y - y
+        dist_to_target = np.sqrt(dx * dx + dy * dy)
+        # Unit vector toward the target, or zero for idle predators and ones already there
+        seek = np.divide(1, dist_to_target, out=np.zeros_like(dist_to_target), where=chasing & (dist_to_target > 0))
+        dx *= seek
+        dy *= seek
+
+        field = self.flow_field
+        if self.follow_field and chasing.any():
+            # Pursue the hunter along the shared field; within a cell or so of
+            # it, or where the field cannot reach, head straight for the target
+            field.retarget(hunter.x, hunter.y)
+            flow_x, flow_y, steps = field.sample(x, y)
+            along = chasing & (steps > 1) & (steps != UNREACHED)
+            dx[along] = flow_x[along]
+            dy[along] = flow_y[along]
+
+        if self.separation_radius and chasing.any():
+            # Idle neighbours push chasers away too, but never move themselves
+            push_x, push_y = separation(x, y, self.separation_radius)
+            dx[chasing] += push_x[chasing] * self.separation_weight
+            dy[chasing] += push_y[chasing] * self.separation_weight
+            # Never faster than full speed, whatever the mix of seek and push
+            length = np.sqrt(dx * dx + dy * dy)
+            np.divide(dx, length, out=dx, where=length > 1)
+            np.divide(dy, length, out=dy, where=length > 1)
+
+        step = self.speed[rows] * dt
+        moving = (dx != 0) | (dy != 0)
+        x += dx * step
+        y += dy * step
+
+        if field is not None and field.obstacles:
+            # Moves that end inside an obstacle are undone
+            blocked = moving & field.blocked_at(x, y)
+            x[blocked] = self.prev_x[rows][blocked]
+            y[blocked] = self.prev_y[rows][blocked]
+            moving &= ~blocked
+
+        # Only predators that moved need their hunter distance refreshed
+        moved = np.flatnonzero(moving)
+        dx = hunter.x - x[moved]
+        dy = hunter.y - y[moved]
+        dist_sq[moved] = dx * dx + dy * dy
+
+        visible = (dist_sq <= hunter.detection_radius * hunter.detection_radius) | chasing
+
+        # Fancy-indexed rows are copies, so write them back
+        self.x[rows] = x
+        self.y[rows] = y
+        self.chasing[rows] = chasing
+        self.target_x[rows] = target_x
+        self.target_y[rows] = target_y
+        self.visible[rows] = visible
+        self.dist_sq[rows] = dist_sq
+
+        return moved if indices is None else np.asarray(indices)[moved]
@@ -0,0 +1,56 @@
+import argparse
+import math
+import time
+from typing import Dict
+
+import numpy as np
+
+from constants import FPS, SCREEN_WIDTH, SCREEN_HEIGHT
+from flowfield import OBSTACLE_LAYOUTS, PURSUIT_MODES, FlowField, obstacle_rects
+from main import Hunter
+from predators import PredatorStore
+
+
+# n chasers start on the right edge of the arena and pursue a hunter pacing
+# on the left, with the obstacle layout in between. Separation is off so the
+# result only reflects how well each pursuit mode gets around the obstacles.
+def run_pursuit(pursuit: str, layout: str, n: int, ticks: int, seed: int) -> Dict[str, float]:
+    field = FlowField(SCREEN_WIDTH, SCREEN_HEIGHT, obstacles=obstacle_rects(layout, SCREEN_WIDTH, SCREEN_HEIGHT))
+    store = PredatorStore(capacity=n, detection_radius=math.inf, separation_radius=0)
+    store.flow_field = field
+    store.follow_field = pursuit == "flow"
+    hunter = Hunter(150, SCREEN_HEIGHT // 2)
+
+    rng = np.random.default_rng(seed)
+    while len(store) < n:
+        x = rng.uniform(SCREEN_WIDTH * 0.75, SCREEN_WIDTH)
+        y = rng.uniform(0, SCREEN_HEIGHT)
+        if not field.is_blocked(x, y):
+            store.add(x, y, 150)
+
+    start = time.perf_counter()
+    for tick in range(ticks):
+        hunter.x = 150 + 60 * math.sin(tick / 40)
+        store.update(hunter, 1 / FPS)
+    elapsed = time.perf_counter() - start
+
+    x, y = store.x[:n], store.y[:n]
+    return {
+        "tick_ms": elapsed / ticks * 1000,
+        "reached": float((np.hypot(x - hunter.x, y - hunter.y) < 100).mean()),
+        "recomputes": field.recomputes,
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Chasers reaching the hunter through obstacles, per pursuit mode")
+    parser.add_argument("--n", type=int, default=3000, help="number of chasing predators")
+    parser.add_argument("--ticks", type=int, default=900)
+    parser.add_argument("--obstacles", default="walls", choices=sorted(OBSTACLE_LAYOUTS))
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    print(f"{'pursuit':<8} {'tick_ms':>8} {'reached':>8} {'field_recomputes':>17}")
+    for pursuit in PURSUIT_MODES:
+        result = run_pursuit(pursuit, args.obstacles, args.n, args.ticks, args.seed)
+        print(f"{pursuit:<8} {result['tick_ms']:>8.3f} {result['reached']:>8.0%} {result['recomputes']:>17}")
@@ -2,11 +2,13 @@ import pygame
 import random
 import math
 from enum import Enum
-from typing import List, Tuple, Optional
+from typing import List, Tuple
 from dataclasses import dataclass
 import time
 import tracemalloc
 
+from visibility import blink_visible
+
 # Initialize Pygame
 pygame.init()
 
@@ -41,18 +43,22 @@ class GameState(Enum):
     GAME_OVER = "game_over"
 
 class Hunter:
+    __slots__ = ("x", "y", "detection_radius", "stealth_mode", "stealth_cooldown",
+                 "score", "initial_x", "initial_y", "distance_traveled")
+
+    speed = 5
+    base_detection_radius = 200  # Increased from 150
+    stealth_duration = 3000  # 3 seconds
+    stealth_recovery = 5000  # 5 seconds
+    size = 20  # Player size
+
     def __init__(self, x: int, y: int):
         self.x = x
         self.y = y
-        self.speed = 5
-        self.base_detection_radius = 200  # Increased from 150
         self.detection_radius = self.base_detection_radius
         self.stealth_mode = False
         self.stealth_cooldown = 0
-        self.stealth_duration = 3000  # 3 seconds
-        self.stealth_recovery = 5000  # 5 seconds
         self.score = 0
-        self.size = 20  # Player size
         self.initial_x = x # Store the starting position of the player
         self.initial_y = y
         self.distance_traveled = 0
@@ -95,65 +101,71 @@ class Hunter:
             self.stealth_mode = False
             self.detection_radius = self.base_detection_radius
 
+# dist_sq is the squared distance to the hunter, written by the capture pass
+# in Game.check_collisions and read back when drawing
 class Creature:
+    __slots__ = ("x", "y", "type", "spawn_time", "dist_sq")
+
     def __init__(self, x: int, y: int, creature_type: CreatureType):
         self.x = x
         self.y = y
         self.type = creature_type
         self.spawn_time = pygame.time.get_ticks()
-        self.visible = not creature_type.nocturnal
-        self.last_visibility_toggle = self.spawn_time
+        self.dist_sq = math.inf
 
-    def update(self, current_time: int):
-        if self.type.nocturnal:
-            if current_time - self.last_visibility_toggle >= self.type.visibility_duration:
-                self.visible = not self.visible
-                self.last_visibility_toggle = current_time
+    def visible_at(self, current_time: float) -> bool:
+        return blink_visible(self.type, current_time - self.spawn_time)
 
-    def is_visible(self, hunter: Hunter) -> bool:
-        dx = self.x - hunter.x
-        dy = self.y - hunter.y
-        dist = math.sqrt(dx * dx + dy * dy)
-        return dist <= hunter.detection_radius and self.visible
+    def is_visible(self, hunter: Hunter, current_time: int) -> bool:
+        return self.visible_at(current_time) and self.dist_sq <= hunter.detection_radius * hunter.detection_radius
 
+# The chase target is kept as two floats rather than a (x, y) tuple, so
+# chasing predators do not allocate a new tuple every frame. update() leaves
+# the squared distance to the hunter in dist_sq for collisions and drawing.
 class Predator:
+    __slots__ = ("x", "y", "chasing", "target_x", "target_y", "visible", "dist_sq")
+
+    speed = 2.5
+    radius = 25  # Increased size for better visibility
+    detection_radius = 250
+    detection_radius_sq = detection_radius * detection_radius
+
     def __init__(self, x: int, y: int):
         self.x = x
         self.y = y
-        self.speed = 2.5
-        self.radius = 25  # Increased size for better visibility
-        self.detection_radius = 250
         self.chasing = False
-        self.target: Optional[Tuple[float, float]] = None
+        self.target_x = 0.0
+        self.target_y = 0.0
         self.visible = False
+        self.dist_sq = math.inf
 
     def update(self, hunter: Hunter):
         dx = hunter.x - self.x
         dy = hunter.y - self.y
-        dist = math.sqrt(dx * dx + dy * dy)
+        self.dist_sq = dx * dx + dy * dy
 
-        if dist < self.detection_radius and not hunter.stealth_mode:
+        if self.dist_sq < self.detection_radius_sq and not hunter.stealth_mode:
             self.chasing = True
-            self.target = (hunter.x, hunter.y)
+            self.target_x = hunter.x
+            self.target_y = hunter.y
         elif self.chasing and hunter.stealth_mode:
             self.chasing = False
-            self.target = None
 
-        if self.chasing and self.target:
-            dx = self.target[0] - self.x
-            dy = self.target[1] - self.y
+        if self.chasing:
+            dx = self.target_x - self.x
+            dy = self.target_y - self.y
             dist = math.sqrt(dx * dx + dy * dy)
             if dist > 0:
                 self.x += (dx / dist) * self.speed
                 self.y += (dy / dist) * self.speed
+                dx = hunter.x - self.x
+                dy = hunter.y - self.y
+                self.dist_sq = dx * dx + dy * dy
 
-        self.visible = dist <= hunter.detection_radius # Changed this line
+        self.visible = self.dist_sq <= hunter.detection_radius * hunter.detection_radius # Changed this line
 
     def is_visible(self, hunter:Hunter) -> bool:
-        dx = self.x - hunter.x
-        dy = self.y - hunter.y
-        dist = math.sqrt(dx * dx + dy * dy)
-        return dist <= hunter.detection_radius
+        return self.dist_sq <= hunter.detection_radius * hunter.detection_radius
 
 class Game:
     def __init__(self):
@@ -196,6 +208,7 @@ class Game:
 
     def precomputed_spawning_refactored(self):
         spawn_threshold = 200  
+        spawn_threshold_sq = spawn_threshold * spawn_threshold
         min_spacing = 100   
 
         current_time = pygame.time.get_ticks()
@@ -205,9 +218,9 @@ class Game:
 
         for spawn_location in self.potential_predator_spawns:
 
-            dist_to_hunter = math.sqrt((spawn_location[0] - self.hunter.x) ** 2 + (spawn_location[1] - self.hunter.y) ** 2)
+            dist_sq_to_hunter = (spawn_location[0] - self.hunter.x) ** 2 + (spawn_location[1] - self.hunter.y) ** 2
 
-            if dist_to_hunter < spawn_threshold:
+            if dist_sq_to_hunter < spawn_threshold_sq:
                 too_close = False
                 for predator in self.predators:
                     dist_to_predator = math.sqrt((spawn_location[0] - predator.x) ** 2 + (spawn_location[1] - predator.y) ** 2)
@@ -221,29 +234,34 @@ class Game:
                     self.last_spawn_time = current_time
                     
                     self.potential_predator_spawns.remove(spawn_location)
-                    self.predators.append(Predator(spawn_location[0], spawn_location[1]))
+                    predator = Predator(spawn_location[0], spawn_location[1])
+                    predator.dist_sq = dist_sq_to_hunter
+                    self.predators.append(predator)
                     break
 
-    def check_collisions(self):
-        # Check creature captures
-        for creature in self.creatures[:]:
+    def check_collisions(self, current_time: int):
+        # Check creature captures in one pass, packing the survivors to the
+        # front of the list instead of removing captured ones one by one
+        detection_radius_sq = self.hunter.detection_radius * self.hunter.detection_radius
+        creatures = self.creatures
+        kept = 0
+        for creature in creatures:
             dx = self.hunter.x - creature.x
             dy = self.hunter.y - creature.y
-            dist = math.sqrt(dx * dx + dy * dy)
-            if dist < self.hunter.detection_radius and creature.visible:
+            creature.dist_sq = dx * dx + dy * dy
+            if creature.dist_sq < detection_radius_sq and creature.visible_at(current_time):
                 self.hunter.score += creature.type.points
-                self.creatures.remove(creature)
+            else:
+                creatures[kept] = creature
+                kept += 1
+        del creatures[kept:]
 
         # Check predator collisions
-        for predator in self.predators:
-            dx = self.hunter.x - predator.x
-            dy = self.hunter.y - predator.y
-            dist = math.sqrt(dx * dx + dy * dy)
-
-
-            if dist < predator.radius + self.hunter.size:
-                self.state = GameState.GAME_OVER
-                self.hunter.score += int(self.hunter.distance_traveled/100)
+        # Squared distances were cached by Predator.update (or the spawner) this frame
+        touch = Predator.radius + self.hunter.size
+        if any(predator.dist_sq < touch * touch for predator in self.predators):
+            self.state = GameState.GAME_OVER
+            self.hunter.score += int(self.hunter.distance_traveled/100)
 
     def draw(self):
         # Clear screen with a dark background
@@ -256,8 +274,9 @@ class Game:
                          2)  # Just the outline
         
         # Draw visible creatures
+        current_time = pygame.time.get_ticks()
         for creature in self.creatures:
-            if creature.is_visible(self.hunter):
+            if creature.is_visible(self.hunter, current_time):
                 pygame.draw.circle(self.screen, creature.type.color,
                                  (int(creature.x), int(creature.y)),
                                  creature.type.radius)
@@ -348,7 +367,7 @@ class Game:
                 # Spawn new entities
                 self.precomputed_spawning_refactored()
                 
-                self.check_collisions()
+                self.check_collisions(current_time)
 
                 self.score_delay += 1
 
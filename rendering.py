@@ -0,0 +1,91 @@
+from collections import OrderedDict
+from typing import Dict, NamedTuple, Tuple
+
+import pygame
+
+Color = Tuple[int, int, int]
+
+# Sprite background colour; no entity is drawn in it
+TRANSPARENT = (255, 0, 255)
+
+
+# A pre-rendered entity and the distance from its top-left corner to the
+# entity's centre, so the blit position is the centre minus offset on both axes
+class Sprite(NamedTuple):
+    surface: pygame.Surface
+    offset: int
+
+
+# Entity appearances rasterized once and reused every frame. Every entity is
+# a filled circle with a thin ring around it, so an appearance is keyed by
+# the colours and radii of those two. The circles have no soft edges, so
+# the sprites use a run-length encoded colour key rather than per-pixel
+# alpha: blitting one copies the opaque runs and skips the rest, which
+# beats both an alpha blend and drawing the circles again. Surfaces are
+# converted to the display format, so the display mode must be set before
+# the first sprite is made.
+class SpriteCache:
+    def __init__(self, transparent: Color = TRANSPARENT):
+        self.transparent = transparent
+        self.sprites: Dict[Tuple, Sprite] = {}
+
+    def __len__(self):
+        return len(self.sprites)
+
+    def circle(self, color: Color, radius: int, glow_color: Color, glow_radius: int, glow_width: int = 2) -> Sprite:
+        key = (color, radius, glow_color, glow_radius, glow_width)
+        sprite = self.sprites.get(key)
+        if sprite is None:
+            offset = max(radius, glow_radius)
+            surface = pygame.Surface((2 * offset + 1, 2 * offset + 1)).convert()
+            surface.fill(self.transparent)
+            centre = (offset, offset)
+            pygame.draw.circle(surface, color, centre, radius)
+            pygame.draw.circle(surface, glow_color, centre, glow_radius, glow_width)
+            surface.set_colorkey(self.transparent, pygame.RLEACCEL)
+            sprite = self.sprites[key] = Sprite(surface, offset)
+        return sprite
+
+
+# Rendered text surfaces keyed by (text, colour, antialias). Strings that
+# never change are pinned once at startup; everything else, like HUD values,
+# goes through a bounded LRU, so a value is only rendered again after it
+# changes and the cache cannot grow with every score the game reaches.
+class TextCache:
+    def __init__(self, font: pygame.font.Font, capacity: int = 64):
+        self.font = font
+        self.capacity = capacity
+        self.pinned: Dict[Tuple, pygame.Surface] = {}
+        self.recent: "OrderedDict[Tuple, pygame.Surface]" = OrderedDict()
+        self.renders = 0
+
+    def __len__(self):
+        return len(self.pinned) + len(self.recent)
+
+    def pin(self, text: str, color: Color, antialias: bool = True) -> pygame.Surface:
+        key = (text, color, antialias)
+        surface = self.pinned.get(key)
+        if surface is None:
+            surface = self.recent.pop(key, None)
+            if surface is None:
+                surface = self.draw(text, color, antialias)
+            self.pinned[key] = surface
+        return surface
+
+    def render(self, text: str, color: Color, antialias: bool = True) -> pygame.Surface:
+        key = (text, color, antialias)
+        surface = self.pinned.get(key)
+        if surface is not None:
+            return surface
+        surface = self.recent.get(key)
+        if surface is not None:
+            self.recent.move_to_end(key)
+            return surface
+        surface = self.recent[key] = self.draw(text, color, antialias)
+        if len(self.recent) > self.capacity:
+            self.recent.popitem(last=False)
+        return surface
+
+    def draw(self, text: str, color: Color, antialias: bool) -> pygame.Surface:
+        self.renders += 1
+        return self.font.render(text, antialias, color)
@@ -0,0 +1,447 @@
+import math
+from collections import deque
+from itertools import islice
+from typing import Callable, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from spatial import SpawnPoolIndex, pool_cell_size
+
+# Vectorised obstacle test: True for every point (x[i], y[i]) that is blocked
+BlockedFilter = Callable[[np.ndarray, np.ndarray], np.ndarray]
+
+
+# Candidate spawn points covering the annulus inner_radius < r < outer_radius,
+# stored as offsets from the centre. The unit circle is tabulated once, and the
+# rings sit at the middle of equal-width bands so every candidate is strictly
+# inside the annulus instead of on its floating-point edge.
+class AnnulusSampler:
+    def __init__(self, inner_radius: float, outer_radius: float, num_angles: int = 360, num_rings: int = 4):
+        self.inner_radius = inner_radius
+        self.outer_radius = outer_radius
+
+        angles = np.linspace(0, 2 * math.pi, num_angles, endpoint=False)
+        self.unit_x = np.cos(angles)
+        self.unit_y = np.sin(angles)
+
+        bands = (np.arange(num_rings) + 0.5) / num_rings
+        radii = inner_radius + (outer_radius - inner_radius) * bands
+
+        # Angle-major order, so the first valid candidate is the lowest angle like the scalar loop
+        self.offset_x = (self.unit_x[:, None] * radii[None, :]).ravel()
+        self.offset_y = (self.unit_y[:, None] * radii[None, :]).ravel()
+
+    def sample(self, cx: float, cy: float, occupied: np.ndarray, min_spacing: float,
+               width: float, height: float, blocked: Optional[BlockedFilter] = None) -> Optional[Tuple[float, float]]:
+        xs = cx + self.offset_x
+        ys = cy + self.offset_y
+
+        valid = (xs >= 0) & (xs <= width) & (ys >= 0) & (ys <= height)
+        if blocked is not None:
+            valid &= ~blocked(xs, ys)
+
+        dist_sq = (xs - cx) ** 2 + (ys - cy) ** 2
+        valid &= (dist_sq > self.inner_radius ** 2) & (dist_sq < self.outer_radius ** 2)
+
+        # occupied is an (N, 2) array of positions that candidates must keep min_spacing from
+        if len(occupied):
+            dx = xs[:, None] - occupied[None, :, 0]
+            dy = ys[:, None] - occupied[None, :, 1]
+            valid &= ((dx * dx + dy * dy) >= min_spacing ** 2).all(axis=1)
+
+        index = int(np.argmax(valid))
+        if not valid[index]:
+            return None
+        return (float(xs[index]), float(ys[index]))
+
+
+# Bitmap of blocked directions on a spawn ring around the hunter: bit i is set
+# when the ring point at angle i * 360 / num_bins is off-screen, inside an
+# obstacle or closer than min_spacing to a predator. Each predator near the ring blocks one arc, which
+# is cached until the predator or the hunter moves, so an update costs time
+# proportional to the nearby predators and a free angle is the lowest clear bit.
+class AngularOccupancy:
+    def __init__(self, ring_radius: float, min_spacing: float, num_bins: int = 360):
+        self.ring_radius = ring_radius
+        self.min_spacing = min_spacing
+        self.num_bins = num_bins
+        self.bin_angle = 2 * math.pi / num_bins
+        self.full_mask = (1 << num_bins) - 1
+
+        angles = [i * self.bin_angle for i in range(num_bins)]
+        self.unit_x = [math.cos(angle) for angle in angles]
+        self.unit_y = [math.sin(angle) for angle in angles]
+        self.ring_x = np.array(self.unit_x) * ring_radius
+        self.ring_y = np.array(self.unit_y) * ring_radius
+
+        self.center: Optional[Tuple[float, float]] = None
+        self.bounds_mask = 0
+        self.arcs = {}
+        self.blocked = 0
+
+    def arc_mask(self, center_angle: float, half_width: float) -> int:
+        if half_width >= math.pi:
+            return self.full_mask
+
+        first = math.ceil((center_angle - half_width) / self.bin_angle)
+        last = math.floor((center_angle + half_width) / self.bin_angle)
+        if last < first:
+            return 0
+
+        length = last - first + 1
+        start = first % self.num_bins
+        mask = ((1 << length) - 1) << start
+        # Fold the part that wrapped past 360 degrees back onto the low bits
+        return (mask | (mask >> self.num_bins)) & self.full_mask
+
+    def predator_mask(self, dx: float, dy: float) -> int:
+        radius = self.ring_radius
+        dist_sq = dx * dx + dy * dy
+        dist = math.sqrt(dist_sq)
+        if abs(dist - radius) >= self.min_spacing:
+            return 0
+        if dist == 0:
+            return self.full_mask
+
+        # Law of cosines: the ring point at angle t is too close when cos(t - phi) > c
+        c = (radius * radius + dist_sq - self.min_spacing * self.min_spacing) / (2 * radius * dist)
+        if c >= 1:
+            return 0
+        if c <= -1:
+            return self.full_mask
+        return self.arc_mask(math.atan2(dy, dx), math.acos(c))
+
+    def edge_mask(self, cx: float, cy: float, width: float, height: float) -> int:
+        radius = self.ring_radius
+        mask = 0
+
+        # For each screen edge, the ring points past it form one arc
+        c = -cx / radius
+        if c > -1:
+            mask |= self.arc_mask(math.pi, math.pi - math.acos(min(c, 1)))
+        c = (width - cx) / radius
+        if c < 1:
+            mask |= self.arc_mask(0, math.acos(max(c, -1)))
+        c = -cy / radius
+        if c > -1:
+            mask |= self.arc_mask(1.5 * math.pi, 0.5 * math.pi + math.asin(min(c, 1)))
+        c = (height - cy) / radius
+        if c < 1:
+            mask |= self.arc_mask(0.5 * math.pi, 0.5 * math.pi - math.asin(max(c, -1)))
+        return mask
+
+    def obstacle_mask(self, cx: float, cy: float, blocked: BlockedFilter) -> int:
+        mask = 0
+        for index in np.flatnonzero(blocked(cx + self.ring_x, cy + self.ring_y)).tolist():
+            mask |= 1 << index
+        return mask
+
+    def update(self, cx: float, cy: float, nearby_predators, width: float, height: float,
+               blocked: Optional[BlockedFilter] = None):
+        # Screen edges and obstacles never move, so their bins change only with the hunter
+        moved = self.center != (cx, cy)
+        if moved:
+            self.center = (cx, cy)
+            self.bounds_mask = self.edge_mask(cx, cy, width, height)
+            if blocked is not None:
+                self.bounds_mask |= self.obstacle_mask(cx, cy, blocked)
+
+        blocked = self.bounds_mask
+        arcs = {}
+        for predator in nearby_predators:
+            cached = self.arcs.get(predator)
+            if not moved and cached is not None and cached[0] == predator.x and cached[1] == predator.y:
+                mask = cached[2]
+            else:
+                mask = self.predator_mask(predator.x - cx, predator.y - cy)
+            arcs[predator] = (predator.x, predator.y, mask)
+            blocked |= mask
+
+        # Predators that left the neighbourhood simply drop out of the cache
+        self.arcs = arcs
+        self.blocked = blocked
+
+    def first_free_point(self) -> Optional[Tuple[float, float]]:
+        free = ~self.blocked & self.full_mask
+        if not free:
+            return None
+
+        index = (free & -free).bit_length() - 1
+        cx, cy = self.center
+        return (cx + self.ring_radius * self.unit_x[index], cy + self.ring_radius * self.unit_y[index])
+
+
+# Offsets of the background-grid cells that can hold a point closer than the
+# radius when the cell size is radius / sqrt(2): the 5x5 block minus its corners
+NEIGHBOUR_OFFSETS = np.array([(di, dj) for di in range(-2, 3) for dj in range(-2, 3) if abs(di) + abs(dj) < 4])
+# A periodic grid's cells can come out slightly smaller, so it checks all 25
+BLOCK_OFFSETS = np.array([(di, dj) for di in range(-2, 3) for dj in range(-2, 3)])
+
+
+# Points poisson_disk_samples reliably fits per radius^2 of area; it measures
+# 0.61-0.74, highest when the area is small next to the radius
+POISSON_DENSITY = 0.55
+
+
+# Blue-noise points in [0, width) x [0, height) with no two closer than radius.
+# This is Bridson's algorithm run on the whole active list at once: every
+# active point throws a few candidates per round, the candidates are checked
+# against the background grid in bulk, and conflicts between candidates of
+# the same round are resolved by a random priority. A candidate whose own
+# cell is taken is rejected outright; the rest are measured only against
+# the occupied cells among the 5x5 around them. A point retires after
+# `attempts` failed candidates, exactly like the scalar algorithm. Growth
+# starts from a sparse jittered lattice of seeds rather than a single point,
+# so the number of rounds does not grow with the size of the domain.
+#
+# Candidates land between radius and spread * radius from their parent; 2 is
+# Bridson's choice, and a narrower ring packs the points tighter.
+#
+# With periodic=True the domain wraps around like a torus, so copies of the
+# result laid edge to edge still keep every pair radius apart. The domain
+# must then be at least 2 * radius on each side.
+def poisson_disk_samples(width: float, height: float, radius: float, rng: np.random.Generator,
+                         attempts: int = 30, per_round: int = 4, spread: float = 2.0,
+                         periodic: bool = False) -> np.ndarray:
+    radius_sq = radius * radius
+    if periodic:
+        # Whole cells of at most radius / sqrt(2) tile each side exactly, without padding
+        cols = int(math.ceil(width * math.sqrt(2) / radius))
+        rows = int(math.ceil(height * math.sqrt(2) / radius))
+        cell_w = width / cols
+        cell_h = height / rows
+        col, row = np.meshgrid(np.arange(cols), np.arange(rows))
+        table = (((row.ravel()[:, None] + BLOCK_OFFSETS[:, 0]) % rows) * cols
+                 + (col.ravel()[:, None] + BLOCK_OFFSETS[:, 1]) % cols)
+        grid_size = rows * cols
+    else:
+        # Two cells of padding on every side, so neighbour lookups never leave the grid
+        cell_w = cell_h = radius / math.sqrt(2)
+        cols = int(math.ceil(width / cell_w)) + 4
+        grid_size = cols * (int(math.ceil(height / cell_h)) + 4)
+        offsets = NEIGHBOUR_OFFSETS[:, 0] * cols + NEIGHBOUR_OFFSETS[:, 1]
+
+    # Flattened background grid holding point indices, or -1 when empty.
+    # No cell can hold more than one point.
+    grid = np.full(grid_size, -1, dtype=np.int64)
+    scratch = np.full_like(grid, -1)
+    xs = np.empty(grid.size)
+    ys = np.empty(grid.size)
+
+    def cell_ids(x, y):
+        if periodic:
+            return (np.minimum((y // cell_h).astype(np.int64), rows - 1) * cols
+                    + np.minimum((x // cell_w).astype(np.int64), cols - 1))
+        return ((y // cell_h).astype(np.int64) + 2) * cols + (x // cell_w).astype(np.int64) + 2
+
+    def close_pairs(x, y, ids, lookup, lookup_x, lookup_y):
+        # (row, point) pairs closer than radius; only occupied cells are measured
+        neighbours = lookup[table[ids] if periodic else ids[:, None] + offsets]
+        found_rows, found_cols = np.nonzero(neighbours >= 0)
+        found = neighbours[found_rows, found_cols]
+        dx = lookup_x[found] - x[found_rows]
+        dy = lookup_y[found] - y[found_rows]
+        if periodic:
+            dx -= width * np.round(dx / width)
+            dy -= height * np.round(dy / height)
+        close = dx * dx + dy * dy < radius_sq
+        return found_rows[close], found[close]
+
+    # One seed per block, jittered by less than half the gap so seeds stay
+    # radius apart; a periodic domain is split into whole blocks so that
+    # holds across the wrap too
+    block = 8 * radius
+    if periodic:
+        blocks_x = max(1, int(width // block))
+        blocks_y = max(1, int(height // block))
+        block_w, block_h = width / blocks_x, height / blocks_y
+    else:
+        blocks_x = int(math.ceil(width / block))
+        blocks_y = int(math.ceil(height / block))
+        block_w = block_h = block
+    seed_x, seed_y = np.meshgrid(np.arange(blocks_x) * block_w + block_w / 2,
+                                 np.arange(blocks_y) * block_h + block_h / 2)
+    seed_x = seed_x.ravel() + rng.uniform(-1, 1, seed_x.size) * (block_w - radius) / 2
+    seed_y = seed_y.ravel() + rng.uniform(-1, 1, seed_y.size) * (block_h - radius) / 2
+    inside = (seed_x < width) & (seed_y < height)
+    seed_x, seed_y = seed_x[inside], seed_y[inside]
+
+    count = seed_x.size
+    xs[:count] = seed_x
+    ys[:count] = seed_y
+    grid[cell_ids(seed_x, seed_y)] = np.arange(count)
+
+    active = np.arange(count)
+    failures = np.zeros(count, dtype=np.int64)
+
+    while active.size:
+        # Candidates in the annulus [radius, spread * radius) around each active point
+        angle = rng.uniform(0, 2 * math.pi, (active.size, per_round))
+        dist = radius * np.sqrt(rng.uniform(1, spread * spread, (active.size, per_round)))
+        cx = (xs[active, None] + dist * np.cos(angle)).ravel()
+        cy = (ys[active, None] + dist * np.sin(angle)).ravel()
+        parent = np.repeat(np.arange(active.size), per_round)
+
+        if periodic:
+            cx %= width
+            cy %= height
+        else:
+            inside = np.flatnonzero((cx >= 0) & (cx < width) & (cy >= 0) & (cy < height))
+            cx, cy, parent = cx[inside], cy[inside], parent[inside]
+        ids = cell_ids(cx, cy)
+        # Any point already in the candidate's own cell is closer than radius
+        empty = np.flatnonzero(grid[ids] < 0)
+        clear = np.zeros(cx.size, dtype=bool)
+        clear[empty] = True
+        clear[empty[close_pairs(cx[empty], cy[empty], ids[empty], grid, xs, ys)[0]]] = False
+
+        failures += per_round - np.bincount(parent[clear], minlength=active.size)
+
+        # Shuffle the survivors so the array order is a random priority, then keep
+        # the first candidate per cell and drop any that clash with an earlier one
+        order = rng.permutation(np.flatnonzero(clear))
+        cx, cy, ids = cx[order], cy[order], ids[order]
+        first = np.sort(np.unique(ids, return_index=True)[1])
+        cx, cy, ids = cx[first], cy[first], ids[first]
+
+        if ids.size:
+            scratch[ids] = np.arange(ids.size)
+            later, found = close_pairs(cx, cy, ids, scratch, cx, cy)
+            scratch[ids] = -1
+            keep = np.ones(ids.size, dtype=bool)
+            keep[later[found < later]] = False
+            cx, cy, ids = cx[keep], cy[keep], ids[keep]
+
+        new = np.arange(count, count + ids.size)
+        xs[new] = cx
+        ys[new] = cy
+        grid[ids] = new
+        count += ids.size
+
+        retained = failures < attempts
+        active = np.concatenate([active[retained], new])
+        failures = np.concatenate([failures[retained], np.zeros(new.size, dtype=np.int64)])
+
+    return np.column_stack((xs[:count], ys[:count]))
+
+
+# Blue-noise points over a large area in a few milliseconds: one periodic
+# tile of about tile_points points is sampled and repeated edge to edge from
+# a random origin, then cropped to the area. The tile wraps, so spacing holds
+# across the seams. Areas that need no more than a few tiles are sampled
+# directly.
+def tiled_poisson_disk_samples(width: float, height: float, radius: float, rng: np.random.Generator,
+                               tile_points: int = 1024, spread: float = 2.0) -> np.ndarray:
+    side = radius * math.sqrt(tile_points / POISSON_DENSITY)
+    if width * height <= 4 * side * side:
+        return poisson_disk_samples(width, height, radius, rng, spread=spread)
+
+    tile = poisson_disk_samples(side, side, radius, rng, spread=spread, periodic=True)
+    start_x, start_y = -rng.uniform(0, side, 2)
+    origin_x, origin_y = np.meshgrid(np.arange(start_x, width, side), np.arange(start_y, height, side))
+    points = (np.column_stack((origin_x.ravel(), origin_y.ravel()))[:, None, :] + tile[None, :, :]).reshape(-1, 2)
+    inside = (points[:, 0] >= 0) & (points[:, 0] < width) & (points[:, 1] >= 0) & (points[:, 1] < height)
+    return points[inside]
+
+
+# Bounded, self-replenishing supply of spawn candidates. It starts from a
+# precomputed pool, and whenever no live candidate is left within reach of the
+# hunter, or the spawner reports that none of those left is usable, it pulls a
+# small batch from an endless generator that samples the annulus around the
+# hunter's current position. The oldest candidates are
+# evicted past `capacity`, and the index is compacted once consumed entries
+# pile up, so memory stays flat however long the session runs.
+class SpawnStream:
+    def __init__(self, capacity: int, inner_radius: float, outer_radius: float,
+                 width: float, height: float, rng: np.random.Generator, batch: int = 8):
+        self.capacity = capacity
+        self.inner_radius = inner_radius
+        self.outer_radius = outer_radius
+        self.width = width
+        self.height = height
+        self.rng = rng
+        self.batch = batch
+
+        self.center = (width / 2, height / 2)
+        self.source = self.candidates()
+        self.reset([])
+
+    def __len__(self):
+        return len(self.index)
+
+    def candidates(self) -> Iterator[Tuple[float, float]]:
+        while True:
+            # Reads self.center on every batch, so output follows the hunter
+            cx, cy = self.center
+            angle = self.rng.uniform(0, 2 * math.pi, self.batch)
+            # sqrt of a uniform radius-squared spreads points evenly over the annulus area
+            dist = np.sqrt(self.rng.uniform(self.inner_radius ** 2, self.outer_radius ** 2, self.batch))
+            xs = cx + dist * np.cos(angle)
+            ys = cy + dist * np.sin(angle)
+            inside = (xs >= 0) & (xs <= self.width) & (ys >= 0) & (ys <= self.height)
+            yield from zip(xs[inside].tolist(), ys[inside].tolist())
+
+    def reset(self, points: List[Tuple[float, float]]):
+        points = points[-self.capacity:] if points else []
+        self.index = SpawnPoolIndex(points, pool_cell_size(points, self.outer_radius))
+        self.order = deque(range(len(self.index.points)))
+
+    def push(self, point: Tuple[float, float]):
+        self.order.append(self.index.add(point))
+
+        while len(self.index) > self.capacity:
+            oldest = self.order.popleft()
+            if self.index.alive[oldest]:
+                self.index.consume(oldest)
+
+        if len(self.index.points) > 2 * self.capacity:
+            live = [self.index.points[i] for i in self.order if self.index.alive[i]]
+            self.reset(live)
+
+    def replenish(self, cx: float, cy: float):
+        self.center = (cx, cy)
+        if next(self.index.query_radius(cx, cy, self.outer_radius), None) is None:
+            self.refill(cx, cy)
+
+    def refill(self, cx: float, cy: float):
+        # Called directly on a miss: candidates the spawner rejected, e.g. for
+        # spacing, must not hold back new ones while the hunter stands still
+        self.center = (cx, cy)
+        for point in islice(self.source, self.batch):
+            self.push(point)
+
+
+# Walker's alias method, built with Vose's algorithm. After O(n) setup every
+# draw is one uniform column pick plus one biased coin flip, however many
+# outcomes there are and however uneven their weights.
+class AliasTable:
+    def __init__(self, weights: List[float]):
+        total = float(sum(weights))
+        if not weights or total <= 0:
+            raise ValueError("alias table needs at least one positive weight")
+
+        n = len(weights)
+        scaled = [weight * n / total for weight in weights]
+        prob = [1.0] * n
+        alias = list(range(n))
+        small = [i for i, p in enumerate(scaled) if p < 1]
+        large = [i for i, p in enumerate(scaled) if p >= 1]
+        while small and large:
+            low = small.pop()
+            high = large.pop()
+            prob[low] = scaled[low]
+            alias[low] = high
+            # The high column gives away what the low one lacked
+            scaled[high] += scaled[low] - 1
+            (small if scaled[high] < 1 else large).append(high)
+        # Whatever is left is 1 up to rounding error
+
+        self.prob = np.array(prob)
+        self.alias = np.array(alias)
+
+    def __len__(self):
+        return len(self.prob)
+
+    def sample(self, rng: np.random.Generator, size: int) -> np.ndarray:
+        column = rng.integers(len(self.prob), size=size)
+        return np.where(rng.random(size) < self.prob[column], column, self.alias[column])
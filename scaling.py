@@ -0,0 +1,95 @@
+import argparse
+import math
+import random
+from typing import Dict, List
+
+import numpy as np
+
+from constants import SCREEN_WIDTH, SCREEN_HEIGHT
+from headless import HeldKeys, MOVE_KEYS
+from main import Game, GameState
+from memprofile import PHASES
+from spawners import SPAWNERS
+
+BASE_PREDATORS = 50  # predators per screen-sized area, as in a normal session
+
+
+def geometric_series(start: int, stop: int, factor: float) -> List[int]:
+    sizes = []
+    n = start
+    while n <= stop:
+        sizes.append(int(n))
+        n *= factor
+    return sizes
+
+
+# Times each per-frame phase with n predators spread over a world that grows
+# with n, so density (and the work a well-behaved phase does per predator)
+# stays the same as in a normal 50-predator session.
+def measure(n: int, spawner: str, frames: int, warmup: int, seed: int) -> Dict[str, float]:
+    scale = math.sqrt(n / BASE_PREDATORS)
+    world_width = int(SCREEN_WIDTH * scale)
+    world_height = int(SCREEN_HEIGHT * scale)
+
+    # No cap, so the spawner keeps adding predators and its grid spacing
+    # query is measured at every population size
+    game = Game(spawner, seed=seed, max_predators=math.inf,
+                world_width=world_width, world_height=world_height)
+    # Long enough that the level cannot end mid-measurement
+    game.level_time = math.ceil((warmup + frames) / game.tick_rate) + 1
+    game.state = GameState.PLAYING
+    game.start_level()
+
+    positions = game.np_rng.uniform((0, 0), (world_width, world_height), (n, 2))
+    for x, y in positions.tolist():
+        game.add_predator(x, y)
+
+    # The game's own tick and draw, timed phase by phase by the game itself
+    rng = random.Random(seed)
+    totals = dict.fromkeys(PHASES, 0.0)
+    for frame in range(warmup + frames):
+        keys = HeldKeys(frozenset(rng.sample(MOVE_KEYS, rng.randint(0, 2))))
+        game.tick(keys)
+        with game.phase("draw"):
+            game.draw()
+
+        if frame >= warmup:
+            for phase in PHASES:
+                totals[phase] += game.phase_times[phase]
+
+    return {phase: totals[phase] / frames for phase in PHASES}
+
+
+# Least-squares slope of log(cost) against log(n): ~1 is linear, ~2 quadratic
+def fit_exponent(sizes: List[int], costs: List[float]) -> float:
+    usable = [(n, cost) for n, cost in zip(sizes, costs) if cost > 0]
+    if len(usable) < 2:
+        return math.nan
+    log_n = np.log([n for n, _ in usable])
+    log_cost = np.log([cost for _, cost in usable])
+    return float(np.polyfit(log_n, log_cost, 1)[0])
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Per-phase frame cost from 50 up to 100k predators")
+    parser.add_argument("--spawner", default="radial_occupancy", choices=sorted(SPAWNERS))
+    parser.add_argument("--min-n", type=int, default=BASE_PREDATORS)
+    parser.add_argument("--max-n", type=int, default=100_000)
+    parser.add_argument("--factor", type=float, default=2.0, help="ratio between population sizes")
+    parser.add_argument("--frames", type=int, default=10, help="timed frames per size")
+    parser.add_argument("--warmup", type=int, default=2)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    sizes = geometric_series(args.min_n, args.max_n, args.factor)
+    print(f"{'n':>8} " + " ".join(f"{phase + '_ms':>14}" for phase in PHASES))
+
+    results = []
+    for n in sizes:
+        result = measure(n, args.spawner, args.frames, args.warmup, args.seed)
+        results.append(result)
+        print(f"{n:>8} " + " ".join(f"{result[phase] * 1000:>14.4f}" for phase in PHASES), flush=True)
+
+    print("empirical exponent (cost ~ n^k):")
+    for phase in PHASES:
+        print(f"  {phase:<11} k={fit_exponent(sizes, [result[phase] for result in results]):.2f}")
@@ -0,0 +1,48 @@
+import heapq
+from itertools import count
+from typing import Callable, List
+
+TimerCallback = Callable[[float], None]
+
+
+# One pending event. The callback gets the time it was due, so a repeating
+# event can schedule its next run from that rather than from whichever tick
+# happened to fire it.
+class Timer:
+    __slots__ = ("due", "order", "callback")
+
+    def __init__(self, due: float, order: int, callback: TimerCallback):
+        self.due = due
+        self.order = order
+        self.callback = callback
+
+    def __lt__(self, other: "Timer") -> bool:
+        # Timers due together fire in the order they were scheduled
+        return (self.due, self.order) < (other.due, other.order)
+
+
+# Timed game logic on a min-heap keyed by due time. Each tick pops only the
+# events that have come due, so nothing is polled while it waits.
+class Scheduler:
+    def __init__(self):
+        self.heap: List[Timer] = []
+        self.order = count()
+
+    def __len__(self):
+        return len(self.heap)
+
+    def schedule(self, due: float, callback: TimerCallback):
+        heapq.heappush(self.heap, Timer(due, next(self.order), callback))
+
+    def run_due(self, now: float) -> int:
+        # Callbacks may schedule more events; any already due fire in this call too
+        heap = self.heap
+        fired = 0
+        while heap and heap[0].due <= now:
+            timer = heapq.heappop(heap)
+            timer.callback(timer.due)
+            fired += 1
+        return fired
+
+    def clear(self):
+        self.heap.clear()
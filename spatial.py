@@ -0,0 +1,179 @@
+import math
+from typing import Dict, Hashable, Iterator, List, Tuple
+
+
+# Uniform grid of entities (anything with x and y) keyed by integer cell coords.
+# With cell_size equal to the query radius, a query only touches the 3x3 block
+# of cells around the query point, no matter how many items are stored.
+class SpatialHash:
+    def __init__(self, cell_size: float):
+        self.cell_size = cell_size
+        self.cells: Dict[Tuple[int, int], List] = {}
+        self.item_cells: Dict[Hashable, Tuple[int, int]] = {}
+
+    def __len__(self):
+        return len(self.item_cells)
+
+    def cell_of(self, x: float, y: float) -> Tuple[int, int]:
+        return (math.floor(x / self.cell_size), math.floor(y / self.cell_size))
+
+    def insert(self, item):
+        cell = self.cell_of(item.x, item.y)
+        self.cells.setdefault(cell, []).append(item)
+        self.item_cells[item] = cell
+
+    def remove(self, item):
+        cell = self.item_cells.pop(item)
+        bucket = self.cells[cell]
+        bucket.remove(item)
+        if not bucket:
+            del self.cells[cell]
+
+    def move(self, item):
+        # Cheap when the item stays inside its cell, which is nearly every frame
+        old_cell = self.item_cells[item]
+        new_cell = self.cell_of(item.x, item.y)
+        if new_cell == old_cell:
+            return
+
+        bucket = self.cells[old_cell]
+        bucket.remove(item)
+        if not bucket:
+            del self.cells[old_cell]
+        self.cells.setdefault(new_cell, []).append(item)
+        self.item_cells[item] = new_cell
+
+    def clear(self):
+        self.cells.clear()
+        self.item_cells.clear()
+
+    def query_cells(self, x: float, y: float, radius: float) -> Iterator:
+        # Everything in the cells overlapping the query circle's bounding box,
+        # for callers that run the exact distance test themselves in bulk
+        min_cx, min_cy = self.cell_of(x - radius, y - radius)
+        max_cx, max_cy = self.cell_of(x + radius, y + radius)
+
+        for cx in range(min_cx, max_cx + 1):
+            for cy in range(min_cy, max_cy + 1):
+                bucket = self.cells.get((cx, cy))
+                if bucket:
+                    yield from bucket
+
+    def query_radius(self, x: float, y: float, radius: float) -> Iterator:
+        radius_sq = radius * radius
+        min_cx, min_cy = self.cell_of(x - radius, y - radius)
+        max_cx, max_cy = self.cell_of(x + radius, y + radius)
+
+        for cx in range(min_cx, max_cx + 1):
+            for cy in range(min_cy, max_cy + 1):
+                bucket = self.cells.get((cx, cy))
+                if not bucket:
+                    continue
+                for item in bucket:
+                    dx = item.x - x
+                    dy = item.y - y
+                    if dx * dx + dy * dy < radius_sq:
+                        yield item
+
+    def any_within(self, x: float, y: float, radius: float) -> bool:
+        for _ in self.query_radius(x, y, radius):
+            return True
+        return False
+
+
+# Static index over a pool of candidate points, bucketed by grid cell.
+# Consuming a point swap-removes it from its bucket, so both the radius
+# query and consumption are independent of the pool size. For dense pools
+# the cells should be sized to hold a handful of points each (see
+# pool_cell_size), or every query walks thousands of them.
+class SpawnPoolIndex:
+    def __init__(self, points: List[Tuple[float, float]], cell_size: float):
+        self.cell_size = cell_size
+        self.points = list(points)
+        self.buckets: Dict[Tuple[int, int], List[int]] = {}
+        self.slots: List[int] = []
+        self.alive = bytearray(b"\x01" * len(self.points))
+        self.live_count = len(self.points)
+
+        for index, (x, y) in enumerate(self.points):
+            bucket = self.buckets.setdefault(self.cell_of(x, y), [])
+            self.slots.append(len(bucket))
+            bucket.append(index)
+
+    def __len__(self):
+        return self.live_count
+
+    def cell_of(self, x: float, y: float) -> Tuple[int, int]:
+        return (math.floor(x / self.cell_size), math.floor(y / self.cell_size))
+
+    def add(self, point: Tuple[float, float]) -> int:
+        index = len(self.points)
+        bucket = self.buckets.setdefault(self.cell_of(*point), [])
+        self.points.append(point)
+        self.slots.append(len(bucket))
+        self.alive.append(1)
+        self.live_count += 1
+        bucket.append(index)
+        return index
+
+    def query_radius(self, x: float, y: float, radius: float) -> Iterator[int]:
+        radius_sq = radius * radius
+        size = self.cell_size
+        min_cx, _ = self.cell_of(x - radius, y)
+        max_cx, _ = self.cell_of(x + radius, y)
+
+        for cx in range(min_cx, max_cx + 1):
+            # Only the cells of this column that the circle reaches
+            gap = max(cx * size - x, x - (cx + 1) * size, 0)
+            if gap >= radius:
+                continue
+            half = math.sqrt(radius_sq - gap * gap)
+            min_cy = math.floor((y - half) / size)
+            max_cy = math.floor((y + half) / size)
+            for cy in range(min_cy, max_cy + 1):
+                bucket = self.buckets.get((cx, cy))
+                if not bucket:
+                    continue
+                # Walk the bucket backwards by position, so callers can consume
+                # the yielded index: swap-remove fills its slot from the end,
+                # which has been visited already
+                slot = len(bucket)
+                while slot:
+                    slot -= 1
+                    if slot >= len(bucket):
+                        continue
+                    index = bucket[slot]
+                    px, py = self.points[index]
+                    dx = px - x
+                    dy = py - y
+                    if dx * dx + dy * dy < radius_sq:
+                        yield index
+
+    def consume(self, index: int) -> Tuple[float, float]:
+        if not self.alive[index]:
+            raise KeyError(f"spawn point {index} was already consumed")
+
+        point = self.points[index]
+        cell = self.cell_of(*point)
+        bucket = self.buckets[cell]
+        slot = self.slots[index]
+        last = bucket.pop()
+        if last != index:
+            bucket[slot] = last
+            self.slots[last] = slot
+        elif not bucket:
+            del self.buckets[cell]
+
+        self.alive[index] = 0
+        self.live_count -= 1
+        return point
+
+
+# Cell size giving about per_cell points per cell for points spread over
+# their bounding box, capped at max_size (normally the query radius)
+def pool_cell_size(points: List[Tuple[float, float]], max_size: float, per_cell: float = 8) -> float:
+    if len(points) < 2:
+        return max_size
+    xs, ys = zip(*points)
+    area = max(max(xs) - min(xs), 1) * max(max(ys) - min(ys), 1)
+    return min(max_size, math.sqrt(area * per_cell / len(points)))
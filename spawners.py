@@ -0,0 +1,265 @@
+import math
+import os
+from typing import Dict, Type
+
+import numpy as np
+
+from constants import SPAWN_THRESHOLD, MIN_SPACING
+from crowd import neighbour_pairs
+from sampling import AliasTable, AnnulusSampler, AngularOccupancy
+
+SPAWNERS: Dict[str, Type["Spawner"]] = {}
+DEFAULT_SPAWNER = "precomputed_refactored"
+SPAWNER_ENV_VAR = "HUNTER_SPAWNER"
+
+
+def register_spawner(name: str):
+    def decorator(cls):
+        cls.name = name
+        SPAWNERS[name] = cls
+        return cls
+    return decorator
+
+
+def create_spawner(name: str, game) -> "Spawner":
+    if name not in SPAWNERS:
+        raise ValueError(f"Unknown spawner {name!r}, expected one of: {', '.join(sorted(SPAWNERS))}")
+    return SPAWNERS[name](game)
+
+
+def default_spawner_name() -> str:
+    return os.environ.get(SPAWNER_ENV_VAR, DEFAULT_SPAWNER)
+
+
+# A spawning strategy. The game calls spawn() once per simulation tick while playing and
+# reset() on every restart; strategies read and add predators through the game.
+class Spawner:
+    name = ""
+
+    def __init__(self, game):
+        self.game = game
+        # Spawn candidates inside an obstacle are filtered out; None on an open field
+        field = game.flow_field
+        self.blocked_at = field.blocked_at if field.obstacles else None
+
+    def reset(self):
+        pass
+
+    def is_blocked(self, x: float, y: float) -> bool:
+        return self.blocked_at is not None and self.game.flow_field.is_blocked(x, y)
+
+    def spawn(self):
+        raise NotImplementedError
+
+
+"""---------------------------------------------------------------------------------------------------------------------------------
+   -----------  PRECOMPUTED SPAWN -------------------------------------------------------------------------------------------------
+   ---------------------------------------------------------------------------------------------------------------------------------"""
+
+@register_spawner("precomputed_original")
+class PrecomputedOriginalSpawner(Spawner):
+    def spawn(self):
+        game = self.game
+        hunter = game.hunter
+        spawn_threshold = SPAWN_THRESHOLD
+        min_spacing = MIN_SPACING
+
+        if len(game.predators) >= game.max_predators:
+            return
+
+        game.spawn_stream.replenish(hunter.x, hunter.y)
+        spawn_index = game.spawn_stream.index
+        for index in spawn_index.query_radius(hunter.x, hunter.y, spawn_threshold):
+            spawn_location = spawn_index.points[index]
+            # Obstacles never move, so a candidate inside one is dropped for good
+            if self.is_blocked(spawn_location[0], spawn_location[1]):
+                spawn_index.consume(index)
+                continue
+
+            too_close = False
+            for predator in game.predators:
+                dist_to_predator = math.sqrt((spawn_location[0] - predator.x) ** 2 + (spawn_location[1] - predator.y) ** 2)
+                if dist_to_predator < min_spacing:
+                    too_close = True
+                    break
+
+            if not too_close:
+                spawn_index.consume(index)
+                game.add_predator(spawn_location[0], spawn_location[1])
+                break
+        else:
+            # Nothing in range was usable: fetch fresh candidates for the next tick
+            game.spawn_stream.refill(hunter.x, hunter.y)
+
+
+@register_spawner("precomputed_refactored")
+class PrecomputedRefactoredSpawner(Spawner):
+    cooldown = 2000  # ms between spawns
+
+    def __init__(self, game):
+        super().__init__(game)
+        self.cooling_down = False
+
+    def reset(self):
+        self.cooling_down = False
+
+    def end_cooldown(self, current_time: float):
+        self.cooling_down = False
+
+    def spawn(self):
+        game = self.game
+        hunter = game.hunter
+        spawn_threshold = SPAWN_THRESHOLD
+        min_spacing = MIN_SPACING
+
+        # Wait for a cooldown and for the hunter to leave the start position
+        current_time = game.current_time
+        if len(game.predators) >= game.max_predators or self.cooling_down or (hunter.x == game.world_width // 2 and hunter.y == game.world_height // 2):
+            return
+
+        game.spawn_stream.replenish(hunter.x, hunter.y)
+        spawn_index = game.spawn_stream.index
+        for index in spawn_index.query_radius(hunter.x, hunter.y, spawn_threshold):
+            spawn_location = spawn_index.points[index]
+            if self.is_blocked(spawn_location[0], spawn_location[1]):
+                spawn_index.consume(index)
+                continue
+
+            if not game.predator_grid.any_within(spawn_location[0], spawn_location[1], min_spacing):
+                # The game's scheduler lifts the cooldown once it has run out
+                self.cooling_down = True
+                game.scheduler.schedule(current_time + self.cooldown, self.end_cooldown)
+
+                spawn_index.consume(index)
+                game.add_predator(spawn_location[0], spawn_location[1])
+                break
+        else:
+            game.spawn_stream.refill(hunter.x, hunter.y)
+
+
+"""---------------------------------------------------------------------------------------------------------------------------------
+   -----------  RADIAL SPAWN  ------------------------------------------------------------------------------------------------------
+   ---------------------------------------------------------------------------------------------------------------------------------"""
+
+# insert new spawning algo here
+
+@register_spawner("radial")
+class RadialSpawner(Spawner):
+    def spawn(self):
+        game = self.game
+        hunter = game.hunter
+        if len(game.predators) >= game.max_predators:
+            return
+
+        spawn_threshold = SPAWN_THRESHOLD
+        min_spacing = MIN_SPACING
+        num_points = 360
+
+        for angle in range(num_points):
+            rad = math.radians(angle)
+            x = hunter.x + spawn_threshold * math.cos(rad)
+            y = hunter.y + spawn_threshold * math.sin(rad)
+
+            if not (0 <= x <= game.world_width and 0 <= y <= game.world_height) or self.is_blocked(x, y):
+                continue
+
+            dist_to_hunter = math.hypot(x - hunter.x, y - hunter.y)
+
+            if spawn_threshold / 2 < dist_to_hunter < spawn_threshold:
+                if not game.predator_grid.any_within(x, y, min_spacing):
+                    game.add_predator(x, y)
+                    return
+
+
+@register_spawner("radial_vectorized")
+class RadialVectorizedSpawner(Spawner):
+    def __init__(self, game):
+        super().__init__(game)
+        self.sampler = AnnulusSampler(SPAWN_THRESHOLD / 2, SPAWN_THRESHOLD)
+
+    def spawn(self):
+        game = self.game
+        hunter = game.hunter
+        if len(game.predators) >= game.max_predators:
+            return
+
+        # Only predators within reach of the outer ring can block a candidate
+        reach = SPAWN_THRESHOLD + MIN_SPACING
+        nearby = [(predator.x, predator.y) for predator in game.predator_grid.query_radius(hunter.x, hunter.y, reach)]
+        occupied = np.array(nearby, dtype=float).reshape(-1, 2)
+
+        point = self.sampler.sample(hunter.x, hunter.y, occupied, MIN_SPACING, game.world_width, game.world_height,
+                                    self.blocked_at)
+        if point is not None:
+            game.add_predator(point[0], point[1])
+
+
+@register_spawner("radial_occupancy")
+class RadialOccupancySpawner(Spawner):
+    def __init__(self, game):
+        super().__init__(game)
+        # Spawn ring in the middle of the annulus, clear of both strict bounds
+        self.occupancy = AngularOccupancy(SPAWN_THRESHOLD * 0.75, MIN_SPACING)
+
+    def reset(self):
+        self.occupancy = AngularOccupancy(SPAWN_THRESHOLD * 0.75, MIN_SPACING)
+
+    def spawn(self):
+        game = self.game
+        hunter = game.hunter
+        if len(game.predators) >= game.max_predators:
+            return
+
+        occupancy = self.occupancy
+        nearby = game.predator_grid.query_radius(hunter.x, hunter.y, occupancy.ring_radius + MIN_SPACING)
+        occupancy.update(hunter.x, hunter.y, nearby, game.world_width, game.world_height, self.blocked_at)
+
+        point = occupancy.first_free_point()
+        if point is not None:
+            game.add_predator(point[0], point[1])
+
+
+# Keeps game.max_creatures creatures on the field. Types are drawn by
+# spawn_weight from an alias table, and every call places a whole batch:
+# candidates are sampled together, then filtered together for world bounds,
+# obstacles, the hunter's capture radius and spacing from existing creatures
+# and from each other. Whatever the batch falls short by is retried next tick.
+class CreatureSpawner:
+    def __init__(self, game, spacing: float = 30, oversample: int = 2):
+        self.game = game
+        self.spacing = spacing
+        self.oversample = oversample
+        self.types = game.creature_types
+        self.table = AliasTable([creature_type.spawn_weight for creature_type in self.types])
+        # Room for the biggest creature and its glow ring inside the world
+        self.margin = max(creature_type.radius for creature_type in self.types) + 5
+
+    def spawn(self) -> int:
+        game = self.game
+        needed = game.max_creatures - len(game.creatures)
+        if needed <= 0:
+            return 0
+
+        rng = game.np_rng
+        count = max(needed * self.oversample, 8)
+        xs = rng.uniform(self.margin, game.world_width - self.margin, count)
+        ys = rng.uniform(self.margin, game.world_height - self.margin, count)
+
+        # Not where the hunter would catch them straight away
+        hunter = game.hunter
+        keep = (xs - hunter.x) ** 2 + (ys - hunter.y) ** 2 >= hunter.base_detection_radius ** 2
+        if game.flow_field.obstacles:
+            keep &= ~game.flow_field.blocked_at(xs, ys)
+        xs, ys = xs[keep], ys[keep]
+
+        # Of two candidates too close together, the later one goes
+        first, second = neighbour_pairs(xs, ys, self.spacing)
+        keep = np.ones(len(xs), dtype=bool)
+        keep[np.maximum(first, second)] = False
+        points = [(x, y) for x, y in zip(xs[keep].tolist(), ys[keep].tolist())
+                  if not game.creatures.grid.any_within(x, y, self.spacing)][:needed]
+
+        kinds = self.table.sample(rng, len(points)).tolist()
+        for (x, y), kind in zip(points, kinds):
+            game.add_creature(x, y, self.types[kind])
+        return len(points)
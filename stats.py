@@ -0,0 +1,96 @@
+import math
+from typing import Dict, List, Tuple
+
+QUANTILES = (0.5, 0.9, 0.99, 0.999)
+
+
+# Constant-memory summary of a stream of non-negative samples (seconds).
+# Mean and variance use Welford's update; quantiles come from a fixed
+# log-spaced histogram, HDR style, so every reported quantile is within
+# `precision` (relative) of the true value for samples inside
+# [lowest, highest]. Samples outside that range land in the end buckets.
+class StreamingStats:
+    def __init__(self, lowest: float = 1e-9, highest: float = 100.0, precision: float = 0.01):
+        self.lowest = lowest
+        self.log_ratio = math.log1p(precision)
+        self.buckets = [0] * (int(math.log(highest / lowest) / self.log_ratio) + 2)
+
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def record(self, value: float):
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+        if value <= self.lowest:
+            index = 0
+        else:
+            index = min(int(math.log(value / self.lowest) / self.log_ratio) + 1, len(self.buckets) - 1)
+        self.buckets[index] += 1
+
+    @property
+    def variance(self) -> float:
+        return self.m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    @property
+    def stddev(self) -> float:
+        return math.sqrt(self.variance)
+
+    def bucket_bounds(self, index: int) -> Tuple[float, float]:
+        if index == 0:
+            return (0.0, self.lowest)
+        return (self.lowest * math.exp((index - 1) * self.log_ratio), self.lowest * math.exp(index * self.log_ratio))
+
+    def quantile(self, q: float) -> float:
+        if not self.count:
+            return math.nan
+
+        rank = q * (self.count - 1)
+        seen = 0
+        for index, bucket in enumerate(self.buckets):
+            seen += bucket
+            if seen > rank:
+                # Midpoint of the bucket, clamped to what was actually observed
+                low, high = self.bucket_bounds(index)
+                return min(max((low + high) / 2, self.min), self.max)
+        return self.max
+
+    def histogram(self) -> Tuple[List[float], List[int]]:
+        # Bucket edges and counts between the first and last non-empty bucket
+        used = [index for index, bucket in enumerate(self.buckets) if bucket]
+        if not used:
+            return ([], [])
+        indices = range(used[0], used[-1] + 1)
+        edges = [self.bucket_bounds(index)[0] for index in indices] + [self.bucket_bounds(used[-1])[1]]
+        return (edges, [self.buckets[index] for index in indices])
+
+    def summary(self) -> Dict[str, float]:
+        result = {
+            "count": self.count,
+            "mean": self.mean if self.count else math.nan,
+            "stddev": self.stddev,
+            "min": self.min if self.count else math.nan,
+            "max": self.max if self.count else math.nan,
+        }
+        for q in QUANTILES:
+            result[f"p{q * 100:g}"] = self.quantile(q)
+        return result
+
+    def report(self, unit: float = 1e-6, unit_name: str = "us") -> str:
+        if not self.count:
+            return "no samples"
+        parts = [f"n={self.count}"]
+        for key, value in self.summary().items():
+            if key != "count":
+                parts.append(f"{key}={value / unit:.3f}{unit_name}")
+        return " ".join(parts)
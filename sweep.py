@@ -0,0 +1,129 @@
+import argparse
+import itertools
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, NamedTuple
+
+from spawners import SPAWNERS
+
+
+class SweepConfig(NamedTuple):
+    spawner: str
+    seed: int
+    max_predators: int
+    pool_size: int
+    level_time: int
+    memprofile_every: int
+
+
+COLUMNS = [
+    ("spawner", "{:<22}"),
+    ("seed", "{:>5}"),
+    ("max_pred", "{:>8}"),
+    ("pool", "{:>6}"),
+    ("spawned", "{:>7}"),
+    ("score", "{:>7}"),
+    ("mean_us", "{:>9.2f}"),
+    ("p50_us", "{:>8.2f}"),
+    ("p99_us", "{:>9.2f}"),
+    ("p99.9_us", "{:>9.2f}"),
+    ("max_us", "{:>9.2f}"),
+    ("alloc_B", "{:>8.1f}"),
+    ("peak_KB", "{:>8.2f}"),
+    ("wall_s", "{:>7.2f}"),
+]
+
+
+# Runs in a worker process: one complete headless session
+def run_session(config: SweepConfig) -> Dict:
+    # Imported here so each worker opens its own dummy display
+    from headless import run_headless
+    from memprofile import PhaseMemoryProfiler
+
+    profiler = PhaseMemoryProfiler(["spawn"], config.memprofile_every)
+    wall_start = time.perf_counter()
+    game = run_headless(config.spawner, config.seed, config.level_time, report=False,
+                        memory_profiler=profiler, max_predators=config.max_predators,
+                        num_spawn_locations=config.pool_size)
+    wall_time = time.perf_counter() - wall_start
+
+    # Report the pool the game actually built, and refuse a row that would
+    # claim a pool size it never ran with
+    pool_size = len(game.potential_predator_spawns)
+    if pool_size != config.pool_size:
+        raise ValueError(f"{config.spawner} seed {config.seed}: pool of {config.pool_size} requested, "
+                         f"game built {pool_size}")
+
+    stats = game.spawn_stats.summary()
+    memory = profiler.totals["spawn"]
+    traced = max(memory.frames, 1)
+    return {
+        "spawner": config.spawner,
+        "seed": config.seed,
+        "max_pred": config.max_predators,
+        "pool": pool_size,
+        "spawned": len(game.predators),
+        "score": game.hunter.score,
+        "mean_us": stats["mean"] * 1e6,
+        "p50_us": stats["p50"] * 1e6,
+        "p99_us": stats["p99"] * 1e6,
+        "p99.9_us": stats["p99.9"] * 1e6,
+        "max_us": stats["max"] * 1e6,
+        "alloc_B": memory.bytes / traced,
+        "peak_KB": memory.peak / 1024,
+        "wall_s": wall_time,
+    }
+
+
+def sweep(configs: List[SweepConfig], workers: int) -> List[Dict]:
+    # Sessions share nothing, so they spread over every core
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(run_session, configs, chunksize=1))
+
+
+def format_table(rows: List[Dict]) -> str:
+    header = " ".join(fmt.replace(".2f", "").replace(".1f", "").format(name) for name, fmt in COLUMNS)
+    lines = [header, "-" * len(header)]
+    for row in rows:
+        lines.append(" ".join(fmt.format(row[name]) for name, fmt in COLUMNS))
+    return "\n".join(lines)
+
+
+def int_list(text: str) -> List[int]:
+    return [int(value) for value in text.split(",") if value]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Headless benchmark sweep over spawners, seeds and sizes")
+    parser.add_argument("--spawners", default=",".join(sorted(SPAWNERS)),
+                        help="comma separated spawner names (default: all)")
+    parser.add_argument("--seeds", type=int_list, default=[0, 1, 2])
+    parser.add_argument("--max-predators", type=int_list, default=[50])
+    parser.add_argument("--pool-sizes", type=int_list, default=[50])
+    parser.add_argument("--level-time", type=int, default=60, help="session length in seconds")
+    parser.add_argument("--memprofile-every", type=int, default=10, metavar="N",
+                        help="trace spawn allocations every Nth frame")
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--csv", default="", help="also write the results to this CSV file")
+    args = parser.parse_args()
+
+    spawner_names = [name for name in args.spawners.split(",") if name]
+    unknown = set(spawner_names) - set(SPAWNERS)
+    if unknown:
+        parser.error(f"unknown spawner(s): {', '.join(sorted(unknown))}")
+
+    configs = [SweepConfig(*combo, args.level_time, args.memprofile_every)
+               for combo in itertools.product(spawner_names, args.seeds, args.max_predators, args.pool_sizes)]
+
+    wall_start = time.perf_counter()
+    rows = sweep(configs, args.workers)
+    print(format_table(rows))
+    print(f"{len(rows)} sessions on {args.workers} workers in {time.perf_counter() - wall_start:.1f}s")
+
+    if args.csv:
+        import csv
+        with open(args.csv, "w", newline="") as handle:
+            writer = csv.DictWriter(handle, fieldnames=[name for name, _ in COLUMNS])
+            writer.writeheader()
+            writer.writerows(rows)
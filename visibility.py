@@ -0,0 +1,7 @@
+# Nocturnal creatures start hidden and flip every visibility_duration ms, so
+# the number of whole periods since spawning says whether one is showing.
+# Works with any creature type that has nocturnal and visibility_duration.
+def blink_visible(creature_type, age: float) -> bool:
+    if not creature_type.nocturnal:
+        return True
+    return age // creature_type.visibility_duration % 2 == 1